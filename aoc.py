@@ -6,22 +6,32 @@ CLI tool for managing Advent of Code solutions.
 """
 import argparse
 import os
-import sys
 import subprocess
-from bs4 import BeautifulSoup
-import requests
+import sys
+import traceback
 
+# Only the lightweight modules every command needs are imported here. Network,
+# HTML and benchmarking dependencies are imported inside the commands that use
+# them, so `test` and `run` don't pay for requests/bs4 on every call.
 from lib.utils import (
     get_current_day, validate_day, load_session_cookie,
-    parse_day_arg, ensure_directory
+    parse_day_arg, ensure_directory, find_days, unlocked_days
 )
-from lib.aoc_client import AoCClient
-from lib.parser import ProblemParser
-from lib.templates import generate_step_template
+from lib.runner import (
+    solution_path, input_path, run_solution, run_solution_subprocess, extract_answer,
+    run_many, STARTUP_MARKER_ENV, STDIN
+)
+from lib.answer_cache import AnswerCache, answer_key
+from lib.memory import peak_rss, format_bytes
+
+STARTUP_BUDGET_MS = 150  # import-time budget checked by --startup-profile
 
 
 def cmd_init(args):
     """Initialize a day's folder structure."""
+    import requests
+    from lib.aoc_client import AoCClient
+
     try:
         day = parse_day_arg(args.day)
         day = validate_day(day)
@@ -37,71 +47,15 @@ def cmd_init(args):
 
         print(f"Initializing Day {day}...")
 
-        # Create directory
+        # Create directory, step templates and an empty test-input.txt
         ensure_directory(day_dir)
-
-        # Generate step templates
-        print("Creating step1.py and step2.py...")
-        with open(f"{day_dir}/step1.py", 'w') as f:
-            f.write(generate_step_template(day, 1))
-        with open(f"{day_dir}/step2.py", 'w') as f:
-            f.write(generate_step_template(day, 2))
-
-        # Create empty test-input.txt
-        print("Creating test-input.txt...")
-        with open(f"{day_dir}/test-input.txt", 'w') as f:
-            f.write("")
+        write_day_skeleton(day)
 
         # Download problem and input
         try:
             session = load_session_cookie()
-            client = AoCClient(session)
-            parser = ProblemParser()
-
-            # Download problem description
-            print(f"Downloading problem description...")
-            try:
-                html = client.download_problem(day)
-                parts = parser.parse_problem(html)
-
-                if len(parts) >= 1:
-                    with open(f"{day_dir}/step1.md", 'w') as f:
-                        f.write(parts[0])
-                    print("  step1.md created")
-
-                if len(parts) >= 2:
-                    with open(f"{day_dir}/step2.md", 'w') as f:
-                        f.write(parts[1])
-                    print("  step2.md created")
-                elif len(parts) == 1:
-                    print("  step2.md not available yet (complete Part 1 first)")
-                    # Create placeholder
-                    with open(f"{day_dir}/step2.md", 'w') as f:
-                        f.write("# Part 2\n\nComplete Part 1 first to unlock Part 2.")
-            except requests.HTTPError as e:
-                if e.response.status_code == 404:
-                    print(f"  Warning: Day {day} problem not yet available")
-                    # Create placeholders
-                    for part in [1, 2]:
-                        with open(f"{day_dir}/step{part}.md", 'w') as f:
-                            f.write(f"# Day {day} Part {part}\n\nProblem not yet available.")
-                else:
-                    raise
-
-            # Download input
-            print("Downloading input...")
-            try:
-                input_text = client.download_input(day)
-                with open(f"{day_dir}/input.txt", 'w') as f:
-                    f.write(input_text)
-                print("  input.txt downloaded")
-            except requests.HTTPError as e:
-                if e.response.status_code == 404:
-                    print(f"  Warning: Day {day} input not yet available")
-                    with open(f"{day_dir}/input.txt", 'w') as f:
-                        f.write("")
-                else:
-                    raise
+            client = AoCClient(session, offline=args.offline)
+            download_day_files(client, day)
 
         except ValueError as e:
             print(f"Warning: {e}")
@@ -133,9 +87,205 @@ def cmd_init(args):
         sys.exit(1)
 
 
+def write_day_skeleton(day, log=print):
+    """
+    Write the step templates and an empty test-input.txt for a day.
+
+    Args:
+        day: Day number (1-12)
+        log: Called with each progress message
+    """
+    from lib.templates import generate_step_template
+
+    day_dir = f"day{day}"
+
+    log("Creating step1.py and step2.py...")
+    with open(f"{day_dir}/step1.py", 'w') as f:
+        f.write(generate_step_template(day, 1))
+    with open(f"{day_dir}/step2.py", 'w') as f:
+        f.write(generate_step_template(day, 2))
+
+    log("Creating test-input.txt...")
+    with open(f"{day_dir}/test-input.txt", 'w') as f:
+        f.write("")
+
+
+def download_day_files(client, day, log=print, html=None):
+    """
+    Download a day's problem description and input into its folder.
+
+    A day that isn't available yet gets placeholder files; in offline mode,
+    anything missing from the download cache is skipped.
+
+    Args:
+        client: AoCClient to download with
+        day: Day number (1-12)
+        log: Called with each progress message
+        html: Problem page that was already downloaded, to save a request
+
+    Raises:
+        requests.RequestException: On network errors other than a 404
+    """
+    import requests
+    from lib.aoc_client import OfflineError
+    from lib.parser import ProblemParser
+
+    day_dir = f"day{day}"
+    parser = ProblemParser()
+
+    # Download problem description
+    log("Downloading problem description...")
+    try:
+        html = html or client.download_problem(day)
+        parts = parser.parse_problem(html)
+
+        if len(parts) >= 1:
+            with open(f"{day_dir}/step1.md", 'w') as f:
+                f.write(parts[0])
+            log("  step1.md created")
+
+        if len(parts) >= 2:
+            with open(f"{day_dir}/step2.md", 'w') as f:
+                f.write(parts[1])
+            log("  step2.md created")
+        elif len(parts) == 1:
+            log("  step2.md not available yet (complete Part 1 first)")
+            # Create placeholder
+            with open(f"{day_dir}/step2.md", 'w') as f:
+                f.write("# Part 2\n\nComplete Part 1 first to unlock Part 2.")
+    except requests.HTTPError as e:
+        if e.response.status_code == 404:
+            log(f"  Warning: Day {day} problem not yet available")
+            # Create placeholders
+            for part in [1, 2]:
+                with open(f"{day_dir}/step{part}.md", 'w') as f:
+                    f.write(f"# Day {day} Part {part}\n\nProblem not yet available.")
+        else:
+            raise
+    except OfflineError:
+        log("  Skipped: problem description not cached (offline)")
+
+    # Download input
+    log("Downloading input...")
+    try:
+        client.save_input(day, f"{day_dir}/input.txt")
+        log("  input.txt downloaded")
+    except requests.HTTPError as e:
+        if e.response.status_code == 404:
+            log(f"  Warning: Day {day} input not yet available")
+            with open(f"{day_dir}/input.txt", 'w') as f:
+                f.write("")
+        else:
+            raise
+    except OfflineError:
+        log("  Skipped: input not cached (offline)")
+
+
+def cmd_fetch(args):
+    """Download problem descriptions and inputs for several days concurrently."""
+    import requests
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from lib.aoc_client import AoCClient
+
+    try:
+        if args.all:
+            days = unlocked_days()
+        else:
+            days = sorted({validate_day(parse_day_arg(day)) for day in args.days})
+        if not days:
+            raise ValueError("No days to fetch (pass day numbers or --all)")
+        if args.jobs < 1:
+            raise ValueError("--jobs must be at least 1")
+
+        session = load_session_cookie()
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    client = AoCClient(session, offline=args.offline, min_interval=args.delay, pool_size=args.jobs)
+
+    def fetch(day):
+        # each day's messages are printed together once it is done
+        lines = [f"Day {day}:"]
+        if not os.path.exists(f"day{day}"):
+            ensure_directory(f"day{day}")
+            write_day_skeleton(day, log=lines.append)
+        download_day_files(client, day, log=lines.append)
+        return lines
+
+    print(f"Fetching {len(days)} day(s) with {args.jobs} worker(s)...\n")
+    failed = []
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        futures = {executor.submit(fetch, day): day for day in days}
+        for future in as_completed(futures):
+            day = futures[future]
+            try:
+                print('\n'.join(future.result()) + '\n')
+            except requests.RequestException as e:
+                print(f"Day {day}: network error: {e}\n")
+                failed.append(day)
+
+    print(client.transport.metrics.format())
+    if failed:
+        print(f"Failed: {', '.join(f'day{day}' for day in sorted(failed))}")
+        sys.exit(1)
+    print(f"Fetched {len(days)} day(s).")
+
+
+def cmd_arm(args):
+    """Wait for a day to unlock, then download it as soon as it is up."""
+    import requests
+    from lib.aoc_client import AoCClient
+    from lib.unlock import wait_for_unlock, wait_for_input
+
+    try:
+        if args.day:
+            day = validate_day(parse_day_arg(args.day))
+        else:
+            # the next day to unlock; today's puzzle has usually been out for hours
+            upcoming = [day for day in range(1, 13) if day not in unlocked_days()]
+            if not upcoming:
+                raise ValueError("Every day has already unlocked")
+            day = upcoming[0]
+        session = load_session_cookie()
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    day_dir = f"day{day}"
+    client = AoCClient(session)
+
+    try:
+        html = wait_for_unlock(client, day, warmup=args.warmup, timeout=args.timeout)
+
+        if not os.path.exists(day_dir):
+            ensure_directory(day_dir)
+            write_day_skeleton(day)
+        # retried separately: download_day_files() would write an empty input.txt on a 404
+        wait_for_input(client, day, f"{day_dir}/input.txt", timeout=args.timeout)
+        download_day_files(client, day, html=html)
+
+    except TimeoutError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    except requests.RequestException as e:
+        print(f"Network error: {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print("\nCancelled.")
+        sys.exit(1)
+
+    print(f"\n{client.transport.metrics.format()}")
+    print(f"Day {day} ready: {day_dir}/step1.md")
+
+
 def cmd_test(args):
     """Run solution with test input."""
     try:
+        if args.all:
+            run_all_and_report(args.part, test=True, workers=args.jobs)
+            return
+
         day = parse_day_arg(args.day)
         day = validate_day(day)
 
@@ -145,8 +295,7 @@ def cmd_test(args):
             print("Error: Part must be 1 or 2")
             sys.exit(1)
 
-        day_dir = f"day{day}"
-        script_path = f"{day_dir}/step{part}.py"
+        script_path = solution_path(day, part)
 
         if not os.path.exists(script_path):
             print(f"Error: {script_path} not found.")
@@ -154,11 +303,7 @@ def cmd_test(args):
             sys.exit(1)
 
         print(f"Running Day {day} Part {part} with test input...\n")
-        result = subprocess.run(
-            [sys.executable, f"step{part}.py", "--test"],
-            cwd=day_dir
-        )
-        sys.exit(result.returncode)
+        run_and_report(day, part, test=True, isolated=args.isolated, use_cache=not args.no_cache)
 
     except ValueError as e:
         print(f"Error: {e}")
@@ -168,6 +313,10 @@ def cmd_test(args):
 def cmd_run(args):
     """Run solution with real input."""
     try:
+        if args.all:
+            run_all_and_report(args.part, test=False, workers=args.jobs)
+            return
+
         day = parse_day_arg(args.day)
         day = validate_day(day)
 
@@ -177,28 +326,151 @@ def cmd_run(args):
             print("Error: Part must be 1 or 2")
             sys.exit(1)
 
-        day_dir = f"day{day}"
-        script_path = f"{day_dir}/step{part}.py"
+        script_path = solution_path(day, part)
 
         if not os.path.exists(script_path):
             print(f"Error: {script_path} not found.")
             print(f"Run './aoc.py init {day}' first.")
             sys.exit(1)
 
-        print(f"Running Day {day} Part {part} with real input...\n")
-        result = subprocess.run(
-            [sys.executable, f"step{part}.py"],
-            cwd=day_dir
-        )
-        sys.exit(result.returncode)
+        # stdin is only read with an explicit '-i -': in scripts and cron jobs it
+        # is often an empty pipe that has nothing to do with the puzzle
+        input_file = args.input
+        if args.isolated and (input_file or args.stream):
+            raise ValueError("--input and --stream can't be combined with --isolated")
+
+        input_name = "stdin" if input_file == STDIN else input_file or "real input"
+        print(f"Running Day {day} Part {part} with {input_name}...\n")
+        run_and_report(day, part, test=False, isolated=args.isolated, use_cache=not args.no_cache,
+                       input_file=input_file, stream=True if args.stream else None)
 
     except ValueError as e:
         print(f"Error: {e}")
         sys.exit(1)
 
 
+def run_and_report(day, part, test, isolated, use_cache=True, input_file=None, stream=None):
+    """
+    Run a solution and print its answer the way the scripts do.
+
+    Args:
+        day: Day number (1-12)
+        part: Part number (1 or 2)
+        test: Whether to use test input
+        isolated: Run the script in a fresh interpreter instead of in-process
+        use_cache: Reuse and store answers in the answer cache
+        input_file: Input file to use instead of the day's own, or '-' for stdin
+        stream: Force solve_stream() (True), or None to pick it automatically
+    """
+    label = "Test result" if test else "Result"
+
+    # stdin can't be hashed up front, so piped runs skip the cache
+    use_cache = use_cache and input_file != STDIN
+    cache = AnswerCache() if use_cache else None
+    key = cached_answer_key(day, part, test, input_file) if use_cache else None
+    if key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            print(f"{label}: {cached} (cached)")
+            return
+
+    if isolated:
+        result = run_solution_subprocess(day, part, test=test, capture=key is not None)
+        if key is not None:
+            print(result.stdout, end='')
+            print(result.stderr, end='', file=sys.stderr)
+            answer = extract_answer(result.stdout, f"{label}:")
+            if result.returncode == 0 and answer not in (None, '', 'None'):
+                cache.put(key, answer, day=day, part=part, test=test)
+        print(f"Peak RSS: {format_bytes(peak_rss(children=True))}")
+        sys.exit(result.returncode)
+
+    try:
+        answer = run_solution(day, part, test=test, input_file=input_file, stream=stream)
+    except Exception:
+        traceback.print_exc()
+        sys.exit(1)
+
+    print(f"{label}: {answer}")
+    print(f"Peak RSS: {format_bytes(peak_rss())} (harness process, use --isolated for the solution alone)")
+    if key is not None and answer is not None:
+        cache.put(key, answer, day=day, part=part, test=test)
+
+
+def cached_answer_key(day, part, test, input_file=None):
+    """
+    Answer cache key for a solution and its input.
+
+    Args:
+        day: Day number (1-12)
+        part: Part number (1 or 2)
+        test: Whether to use test input
+        input_file: Input file to use instead of the day's own
+
+    Returns:
+        str: Cache key, or None if the input file doesn't exist yet
+    """
+    try:
+        return answer_key(solution_path(day, part), input_file or input_path(day, test))
+    except FileNotFoundError:
+        return None
+
+
+def run_all_and_report(part, test, workers=None):
+    """
+    Run every initialized day concurrently and print a summary table.
+
+    Args:
+        part: Only run this part, or both when None
+        test: Whether to use test input
+        workers: Process pool size (defaults to the CPU count)
+    """
+    from lib.bench import format_duration
+
+    parts = [part] if part else [1, 2]
+    jobs = [(day, p) for day in find_days() for p in parts if os.path.exists(solution_path(day, p))]
+    if not jobs:
+        print("No solutions found. Run './aoc.py init' first.")
+        sys.exit(1)
+
+    input_name = "test input" if test else "real input"
+    print(f"Running {len(jobs)} solutions with {input_name}...\n")
+
+    results = []
+    for result in run_many(jobs, test=test, workers=workers):
+        results.append(result)
+        outcome = result['answer'] if result['error'] is None else "FAILED"
+        print(f"  Day {result['day']} Part {result['part']}: {outcome} ({format_duration(result['elapsed'])})")
+
+    results.sort(key=lambda r: (r['day'], r['part']))
+    failures = [r for r in results if r['error'] is not None]
+    for result in failures:
+        print(f"\nDay {result['day']} Part {result['part']} failed:\n{result['error']}")
+
+    answer_width = max(len("Answer"), *(len(r['answer'] or "FAILED") for r in results))
+    # without a reset, a reused worker's peak covers every job it ran before
+    per_job = all(r['rss_per_job'] for r in results)
+    rss_label = "Peak RSS" if per_job else "Worker RSS"
+    print(f"\n{'Day':>3}  {'Part':>4}  {'Answer':<{answer_width}}  {'Time':>9}  {rss_label:>10}")
+    for result in results:
+        answer = result['answer'] if result['error'] is None else "FAILED"
+        print(f"{result['day']:>3}  {result['part']:>4}  {answer:<{answer_width}}  "
+              f"{format_duration(result['elapsed']):>9}  {format_bytes(result['peak_rss']):>10}")
+
+    if not per_job:
+        print("\nWorker RSS is cumulative: workers are reused, so it covers earlier jobs on the same worker.")
+
+    if failures:
+        sys.exit(1)
+
+
 def cmd_submit(args):
     """Submit solution answer."""
+    import requests
+    from lib.aoc_client import AoCClient
+    from lib.parser import ProblemParser
+    from lib.submissions import SubmissionLedger, CORRECT, REJECTED
+
     try:
         day = parse_day_arg(args.day)
         day = validate_day(day)
@@ -214,43 +486,64 @@ def cmd_submit(args):
             sys.exit(1)
 
         day_dir = f"day{day}"
-        script_path = f"{day_dir}/step{part}.py"
+        script_path = solution_path(day, part)
 
         if not os.path.exists(script_path):
             print(f"Error: {script_path} not found.")
             print(f"Run './aoc.py init {day}' first.")
             sys.exit(1)
 
-        # Run solution to get answer
-        print(f"Running Day {day} Part {part} to get answer...\n")
-        result = subprocess.run(
-            [sys.executable, f"step{part}.py"],
-            cwd=day_dir,
-            capture_output=True,
-            text=True
-        )
-
-        if result.returncode != 0:
-            print("Error: Solution failed to run")
-            print(result.stderr)
-            sys.exit(1)
-
-        # Parse output to get answer
-        output = result.stdout.strip()
-        print(output)
-        print()
+        # Run solution to get answer, unless the answer cache already has it
+        cache = None if args.no_cache else AnswerCache()
+        key = None if args.no_cache else cached_answer_key(day, part, test=False)
+        answer = cache.get(key) if key is not None else None
+
+        if answer is not None:
+            print(f"Result: {answer} (cached)\n")
+        elif args.isolated:
+            print(f"Running Day {day} Part {part} to get answer...\n")
+            result = run_solution_subprocess(day, part, capture=True)
+
+            if result.returncode != 0:
+                print("Error: Solution failed to run")
+                print(result.stderr)
+                sys.exit(1)
+
+            # Parse output to get answer
+            output = result.stdout.strip()
+            print(output)
+            print()
+
+            # Extract answer from output (look for last line with "Result:")
+            answer = extract_answer(output)
+        else:
+            print(f"Running Day {day} Part {part} to get answer...\n")
+            try:
+                answer = run_solution(day, part)
+            except Exception:
+                print("Error: Solution failed to run")
+                traceback.print_exc()
+                sys.exit(1)
 
-        # Extract answer from output (look for last line with "Result:")
-        answer = None
-        for line in output.split('\n'):
-            if 'Result:' in line:
-                answer = line.split('Result:')[-1].strip()
+            answer = None if answer is None else str(answer)
+            print(f"Result: {answer}\n")
 
         if not answer or answer == 'None':
             print("Error: Could not extract answer from solution output")
             print("Make sure your solution prints 'Result: <answer>'")
             sys.exit(1)
 
+        if key is not None:
+            cache.put(key, answer, day=day, part=part, test=False)
+
+        # Don't waste a submission on an answer the ledger already rules out
+        ledger = SubmissionLedger()
+        reason = ledger.check(day, part, answer)
+        if reason and not args.force:
+            print(f"Not submitting: {reason}")
+            print("Use --force to submit anyway.")
+            sys.exit(1)
+
         # Confirm submission
         response = input(f"\nSubmit answer '{answer}' for Day {day} Part {part}? (y/n): ")
         if response.lower() != 'y':
@@ -265,11 +558,13 @@ def cmd_submit(args):
         response_html = client.submit_answer(day, part, answer)
 
         # Parse response
-        result_msg = parse_submission_response(response_html)
+        verdict, result_msg = parse_submission_response(response_html)
         print(f"\n{result_msg}")
+        if verdict == CORRECT or verdict in REJECTED:
+            ledger.record(day, part, answer, verdict)
 
         # If successful and part 1, download step2
-        if "SUCCESS" in result_msg and part == 1:
+        if verdict == CORRECT and part == 1:
             print("\nDownloading Part 2...")
             try:
                 parser = ProblemParser()
@@ -297,6 +592,268 @@ def cmd_submit(args):
         sys.exit(1)
 
 
+def cmd_bench(args):
+    """Time a solution's parse and solve steps over repeated runs."""
+    from lib.bench import benchmark, format_stats
+    from lib.history import make_record, append_record
+
+    try:
+        if args.repeat < 1 or args.warmup < 0:
+            raise ValueError("--repeat must be at least 1 and --warmup at least 0")
+
+        if args.all:
+            days = find_days()
+        else:
+            days = [validate_day(parse_day_arg(args.day))]
+        parts = [args.part] if args.part else [1, 2]
+
+        input_name = "test input" if args.test else "real input"
+        for day in days:
+            for part in parts:
+                script_path = solution_path(day, part)
+                if not os.path.exists(script_path):
+                    if not args.all:
+                        print(f"Error: {script_path} not found.")
+                        print(f"Run './aoc.py init {day}' first.")
+                        sys.exit(1)
+                    continue
+
+                print(f"Day {day} Part {part} ({input_name}, {args.repeat} runs, {args.warmup} warmup)")
+                try:
+                    result = benchmark(day, part, test=args.test, warmup=args.warmup, repeat=args.repeat,
+                                       parsed=args.parsed_cache)
+                except Exception:
+                    traceback.print_exc()
+                    if not args.all:
+                        sys.exit(1)
+                    continue
+
+                print(f"  parse  {format_stats(result['parse'])}")
+                print(f"  solve  {format_stats(result['solve'])}")
+                print(f"  answer {result['answer']}\n")
+
+                if not args.no_record:
+                    record = make_record(day, part, input_path(day, args.test), result,
+                                         args.warmup, args.repeat, parsed_cache=args.parsed_cache)
+                    append_record(record)
+
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+def cmd_compare(args):
+    """Compare the latest benchmark runs against their rolling baseline."""
+    from lib.bench import format_duration
+    from lib.history import load_records, compare_latest
+
+    if args.window < 1:
+        print("Error: --window must be at least 1")
+        sys.exit(1)
+
+    comparisons = compare_latest(load_records(), window=args.window,
+                                 threshold=args.threshold, metric=args.metric)
+    if args.day:
+        try:
+            day = validate_day(parse_day_arg(args.day))
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        comparisons = [c for c in comparisons if c['day'] == day]
+    if args.part:
+        comparisons = [c for c in comparisons if c['part'] == args.part]
+
+    if not comparisons:
+        print("No benchmark history to compare yet. Run './aoc.py bench' at least twice.")
+        return
+
+    regressions = 0
+    for comparison in comparisons:
+        status = "REGRESSION" if comparison['regressed'] else "ok"
+        mode = ", parsed cache" if comparison['parsed_cache'] else ""
+        print(f"Day {comparison['day']} Part {comparison['part']} ({comparison['input']}{mode}, "
+              f"baseline of {comparison['runs']} runs): {status}")
+        for step in ('parse', 'solve'):
+            timing = comparison[step]
+            print(f"  {step}  {format_duration(timing['latest']):>9} vs {format_duration(timing['baseline']):>9}"
+                  f"  ({timing['ratio']:.2f}x)")
+        regressions += comparison['regressed']
+
+    if regressions:
+        print(f"\n{regressions} regression(s) above {args.threshold:.2f}x")
+        sys.exit(1)
+
+
+def cmd_profile(args):
+    """Profile a solution with cProfile or the sampling profiler."""
+    from lib.profiling import profile_solution, sample_solution, write_collapsed, hottest_functions
+    from lib.utils import state_path
+
+    try:
+        day = validate_day(parse_day_arg(args.day))
+        part = args.part if args.part else 1
+
+        script_path = solution_path(day, part)
+        if not os.path.exists(script_path):
+            print(f"Error: {script_path} not found.")
+            print(f"Run './aoc.py init {day}' first.")
+            sys.exit(1)
+
+        input_name = "test input" if args.test else "real input"
+        print(f"Profiling Day {day} Part {part} with {input_name} ({args.mode})...\n")
+
+        if args.mode == 'cprofile':
+            answer, report = profile_solution(day, part, test=args.test, top=args.top, sort=args.sort)
+            print(report)
+        else:
+            answer, stacks = sample_solution(day, part, test=args.test, interval=args.interval)
+            output = args.output or state_path('profiles', f"day{day}-part{part}.folded")
+            write_collapsed(stacks, output)
+
+            total = sum(stacks.values())
+            print(f"{total} samples written to {output}")
+            print("Render with e.g. 'flamegraph.pl {0} > flame.svg' or open it in speedscope.\n".format(output))
+            for label, count in hottest_functions(stacks, args.top):
+                print(f"  {100 * count / total:5.1f}%  {label}")
+            print()
+
+        print(f"Result: {answer}")
+
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+def cmd_memory(args):
+    """Report peak memory and the top allocation sites of a solution."""
+    from lib.memory import trace_solution
+
+    try:
+        day = validate_day(parse_day_arg(args.day))
+        part = args.part if args.part else 1
+
+        script_path = solution_path(day, part)
+        if not os.path.exists(script_path):
+            print(f"Error: {script_path} not found.")
+            print(f"Run './aoc.py init {day}' first.")
+            sys.exit(1)
+
+        input_name = "test input" if args.test else "real input"
+        print(f"Tracing allocations of Day {day} Part {part} with {input_name}...\n")
+
+        report = trace_solution(day, part, test=args.test, top=args.top)
+        for phase, name in (('parse', 'read_input()'), ('solve', 'solve()')):
+            print(f"{name}: traced peak {format_bytes(report[phase]['peak'])}")
+            for stat in report[phase]['sites']:
+                frame = stat.traceback[0]
+                print(f"  {format_bytes(stat.size_diff):>10}  {stat.count_diff:>9} blocks  "
+                      f"{frame.filename}:{frame.lineno}")
+            print()
+
+        print(f"Result: {report['answer']}")
+        print(f"Peak RSS: {format_bytes(peak_rss())} (includes tracemalloc overhead)")
+
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+def cmd_generate(args):
+    """Write a synthetic input file for a day."""
+    from lib.generators import generate_input, GENERATORS
+
+    try:
+        day = validate_day(parse_day_arg(args.day))
+        if day not in GENERATORS:
+            raise ValueError(f"No input generator for day {day} (available: {sorted(GENERATORS)})")
+
+        suffix = '' if args.width is None else f"-w{args.width}"
+        output = args.output or f"day{day}/generated-{args.size}{suffix}.txt"
+        generate_input(day, args.size, output, seed=args.seed, width=args.width)
+        width = '' if args.width is None else f", width {args.width}"
+        print(f"Wrote {output} ({GENERATORS[day][1]} {args.size}{width}, seed {args.seed})")
+
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+def cmd_scale(args):
+    """Time a solution on growing generated inputs and fit its complexity."""
+    from lib.bench import format_duration
+    from lib.generators import GENERATORS, WIDTH_DAYS
+    from lib.scaling import run_scaling
+
+    try:
+        if args.all:
+            generators = WIDTH_DAYS if args.width is not None else GENERATORS
+            days = [day for day in find_days() if day in generators]
+        else:
+            days = [validate_day(parse_day_arg(args.day))]
+            if days[0] not in GENERATORS:
+                raise ValueError(f"No input generator for day {days[0]} (available: {sorted(GENERATORS)})")
+        parts = [args.part] if args.part else [1, 2]
+        sizes = [int(size) for size in args.sizes.split(',')] if args.sizes else None
+
+        for day in days:
+            for part in parts:
+                if not os.path.exists(solution_path(day, part)):
+                    continue
+
+                width = '' if args.width is None else f", width {args.width}"
+                print(f"Day {day} Part {part} (size = {GENERATORS[day][1]}{width}, seed {args.seed})")
+
+                def show(size, seconds, answer):
+                    print(f"  {size:>20,}  {format_duration(seconds):>9}")
+
+                result = run_scaling(day, part, sizes=sizes, seed=args.seed, repeat=args.repeat,
+                                     max_seconds=args.max_seconds, on_result=show, width=args.width)
+                if result['exponent'] is None:
+                    print("  not enough points to fit a curve\n")
+                else:
+                    print(f"  empirical complexity: O(n^{result['exponent']:.2f})\n")
+
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+def cmd_watch(args):
+    """Rerun a day's solutions in this process whenever their files change."""
+    from lib.bench import format_duration
+    from lib.watch import watch
+
+    try:
+        day = validate_day(parse_day_arg(args.day))
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    parts = [args.part] if args.part else [1, 2]
+    parts = [part for part in parts if os.path.exists(solution_path(day, part))]
+    if not parts:
+        print(f"Error: no solutions found for day {day}.")
+        print(f"Run './aoc.py init {day}' first.")
+        sys.exit(1)
+
+    def show(part, test, answer, seconds, error):
+        label = "Test result" if test else "Result"
+        if error:
+            print(error, end='')
+            print(f"Part {part} {label}: failed after {format_duration(seconds)}")
+        else:
+            print(f"Part {part} {label}: {answer}  ({format_duration(seconds)})")
+
+    def changed(paths):
+        print(f"\n--- {', '.join(paths)} changed ---")
+
+    print(f"Watching day {day} (Ctrl+C to stop)")
+    try:
+        watch(day, parts, on_result=show, on_change=changed, interval=args.interval)
+    except KeyboardInterrupt:
+        print("\nStopped.")
+
+
 def parse_submission_response(html):
     """
     Parse submission response to determine success/failure.
@@ -305,29 +862,90 @@ def parse_submission_response(html):
         html: Response HTML
 
     Returns:
-        str: Formatted result message
+        tuple: (verdict, message), with the verdict as one of the constants in
+            lib.submissions and a formatted result message
     """
+    from bs4 import BeautifulSoup
+    from lib import submissions
+
     soup = BeautifulSoup(html, 'html.parser')
     article = soup.find('article')
     if not article:
-        return "Unknown response - check website"
+        return submissions.UNKNOWN, "Unknown response - check website"
 
     text = article.get_text().strip()
 
     if "That's the right answer" in text:
-        return "SUCCESS: Correct answer! ⭐"
+        return submissions.CORRECT, "SUCCESS: Correct answer! ⭐"
     elif "not the right answer" in text:
         if "too high" in text:
-            return "WRONG: Answer is too high"
+            return submissions.TOO_HIGH, "WRONG: Answer is too high"
         elif "too low" in text:
-            return "WRONG: Answer is too low"
-        return "WRONG: Incorrect answer"
+            return submissions.TOO_LOW, "WRONG: Answer is too low"
+        return submissions.WRONG, "WRONG: Incorrect answer"
     elif "gave an answer too recently" in text:
-        return "RATE LIMITED: Please wait before submitting again"
+        return submissions.RATE_LIMITED, "RATE LIMITED: Please wait before submitting again"
     elif "don't seem to be solving the right level" in text:
-        return "ERROR: Already completed or wrong part"
+        return submissions.WRONG_LEVEL, "ERROR: Already completed or wrong part"
 
-    return f"UNKNOWN RESPONSE:\n{text[:300]}"
+    return submissions.UNKNOWN, f"UNKNOWN RESPONSE:\n{text[:300]}"
+
+
+def startup_profile(argv):
+    """
+    Re-run a command under `python -X importtime` and summarize its imports.
+
+    Only the harness's own imports count towards the budget. Whatever a solution
+    imports (numpy, its helper modules) is reported separately: the child marks
+    the moment it starts loading a solution on stderr, and imports after that
+    mark belong to the solution.
+
+    Args:
+        argv: Command line arguments without --startup-profile
+
+    Returns:
+        int: Exit status (1 if the import budget was exceeded)
+    """
+    marker = 'aoc.py: loading solution'
+    command = [sys.executable, '-X', 'importtime', os.path.abspath(__file__)] + argv
+    env = dict(os.environ, **{STARTUP_MARKER_ENV: marker})
+    result = subprocess.run(command, capture_output=True, text=True, env=env)
+
+    imports = []
+    solution_ms = 0.0
+    in_solution = False
+    for line in result.stderr.splitlines():
+        if line == marker:
+            in_solution = True
+            continue
+        if not line.startswith('import time:'):
+            print(line, file=sys.stderr)
+            continue
+        fields = line[len('import time:'):].split('|')
+        if not fields[0].strip().isdigit():
+            continue  # column header
+        name = fields[2].rstrip()
+        # nested imports are indented; only top-level ones add up to the total
+        if name.startswith('  '):
+            continue
+        if in_solution:
+            solution_ms += int(fields[1]) / 1000
+        else:
+            imports.append((int(fields[1]) / 1000, name.strip()))
+
+    print(result.stdout, end='')
+
+    total = sum(ms for ms, _ in imports)
+    print(f"\nStartup imports: {total:.1f}ms (budget {STARTUP_BUDGET_MS}ms)")
+    for ms, name in sorted(imports, reverse=True)[:10]:
+        print(f"  {ms:8.1f}ms  {name}")
+    if in_solution:
+        print(f"Solution imports: {solution_ms:.1f}ms (not counted)")
+
+    if total > STARTUP_BUDGET_MS:
+        print(f"\nImport time is over the {STARTUP_BUDGET_MS}ms budget")
+        return 1
+    return result.returncode
 
 
 def main():
@@ -337,29 +955,147 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
 
+    parser.add_argument('--startup-profile', action='store_true',
+                        help='Report import time of the command and check it against the startup budget')
+
     subparsers = parser.add_subparsers(dest='command', help='Command to run')
 
     # init command
     parser_init = subparsers.add_parser('init', help='Initialize a day')
     parser_init.add_argument('day', nargs='?', help='Day number (e.g., 1 or day1)')
+    parser_init.add_argument('--offline', action='store_true',
+                             help='Use only previously downloaded pages and inputs, without network access')
+
+    # fetch command
+    parser_fetch = subparsers.add_parser('fetch', help='Download problems and inputs for several days at once')
+    parser_fetch.add_argument('days', nargs='*', help='Day numbers (e.g., 1 2 day3)')
+    parser_fetch.add_argument('--all', action='store_true', help='Every day that has unlocked')
+    parser_fetch.add_argument('-j', '--jobs', type=int, default=4, help='Concurrent downloads (default: 4)')
+    parser_fetch.add_argument('--delay', type=float, default=0.5,
+                              help='Minimum seconds between requests, across all workers (default: 0.5)')
+    parser_fetch.add_argument('--offline', action='store_true',
+                              help='Use only previously downloaded pages and inputs, without network access')
+
+    # arm command
+    parser_arm = subparsers.add_parser('arm', help='Wait for a day to unlock and download it immediately')
+    parser_arm.add_argument('day', nargs='?', help='Day number (default: the next day to unlock)')
+    parser_arm.add_argument('--warmup', type=float, default=5.0,
+                            help='Seconds before the unlock to open the connection (default: 5)')
+    parser_arm.add_argument('--timeout', type=float, default=300.0,
+                            help='Seconds after the unlock to keep retrying (default: 300)')
 
     # test command
     parser_test = subparsers.add_parser('test', help='Run with test input')
     parser_test.add_argument('day', nargs='?', help='Day number (e.g., 1 or day1)')
     parser_test.add_argument('-p', '--part', type=int, choices=[1, 2], help='Part number')
+    parser_test.add_argument('--isolated', action='store_true',
+                             help='Run the solution in a separate interpreter')
+    parser_test.add_argument('--no-cache', action='store_true', help="Don't reuse or store cached answers")
+    parser_test.add_argument('--all', action='store_true',
+                             help='Run every initialized day and part concurrently')
+    parser_test.add_argument('-j', '--jobs', type=int, help='Worker processes for --all (default: CPU count)')
 
     # run command
     parser_run = subparsers.add_parser('run', help='Run with real input')
     parser_run.add_argument('day', nargs='?', help='Day number (e.g., 1 or day1)')
     parser_run.add_argument('-p', '--part', type=int, choices=[1, 2], help='Part number')
+    parser_run.add_argument('--isolated', action='store_true',
+                            help='Run the solution in a separate interpreter')
+    parser_run.add_argument('--no-cache', action='store_true', help="Don't reuse or store cached answers")
+    parser_run.add_argument('-i', '--input', help="Input file to use instead of the day's input.txt ('-' for stdin)")
+    parser_run.add_argument('--stream', action='store_true',
+                            help='Use solve_stream() even for small inputs (it is picked automatically '
+                                 'for piped or very large input)')
+    parser_run.add_argument('--all', action='store_true',
+                            help='Run every initialized day and part concurrently')
+    parser_run.add_argument('-j', '--jobs', type=int, help='Worker processes for --all (default: CPU count)')
 
     # submit command
     parser_submit = subparsers.add_parser('submit', help='Submit answer')
     parser_submit.add_argument('day', nargs='?', help='Day number (e.g., 1 or day1)')
     parser_submit.add_argument('-p', '--part', type=int, choices=[1, 2], help='Part number')
+    parser_submit.add_argument('--isolated', action='store_true',
+                               help='Run the solution in a separate interpreter')
+    parser_submit.add_argument('--no-cache', action='store_true', help="Don't reuse or store cached answers")
+    parser_submit.add_argument('--force', action='store_true',
+                               help='Submit even if the ledger says the answer was already tried or is out of bounds')
+
+    # bench command
+    parser_bench = subparsers.add_parser('bench', help='Time a solution over repeated runs')
+    parser_bench.add_argument('day', nargs='?', help='Day number (e.g., 1 or day1)')
+    parser_bench.add_argument('-p', '--part', type=int, choices=[1, 2], help='Part number (default: both)')
+    parser_bench.add_argument('--all', action='store_true', help='Benchmark every initialized day')
+    parser_bench.add_argument('--test', action='store_true', help='Use test input instead of real input')
+    parser_bench.add_argument('--warmup', type=int, default=1, help='Untimed runs before measuring (default: 1)')
+    parser_bench.add_argument('--repeat', type=int, default=10, help='Timed runs (default: 10)')
+    parser_bench.add_argument('--no-record', action='store_true', help="Don't append the run to the history")
+    parser_bench.add_argument('--parsed-cache', action='store_true',
+                              help='Time solutions that have a binary parsed form on the cached, memory-mapped array')
+
+    # compare command
+    parser_compare = subparsers.add_parser('compare', help='Check the latest benchmarks for regressions')
+    parser_compare.add_argument('day', nargs='?', help='Only compare this day')
+    parser_compare.add_argument('-p', '--part', type=int, choices=[1, 2], help='Only compare this part')
+    parser_compare.add_argument('--window', type=int, default=5, help='Earlier runs in the baseline (default: 5)')
+    parser_compare.add_argument('--threshold', type=float, default=1.2,
+                                help='Slowdown ratio that fails the check (default: 1.2)')
+    parser_compare.add_argument('--metric', choices=['min', 'median', 'p95'], default='median',
+                                help='Statistic to compare (default: median)')
+
+    # profile command
+    parser_profile = subparsers.add_parser('profile', help='Profile a solution')
+    parser_profile.add_argument('day', nargs='?', help='Day number (e.g., 1 or day1)')
+    parser_profile.add_argument('-p', '--part', type=int, choices=[1, 2], help='Part number')
+    parser_profile.add_argument('--test', action='store_true', help='Use test input instead of real input')
+    parser_profile.add_argument('--mode', choices=['cprofile', 'sample'], default='cprofile',
+                                help='cProfile function stats, or sampled collapsed stacks (default: cprofile)')
+    parser_profile.add_argument('--top', type=int, default=25, help='Functions to list (default: 25)')
+    parser_profile.add_argument('--sort', default='cumulative', help='cProfile sort key (default: cumulative)')
+    parser_profile.add_argument('--interval', type=float, default=0.001,
+                                help='Seconds between samples in sample mode (default: 0.001)')
+    parser_profile.add_argument('-o', '--output', help='Collapsed stack file for sample mode '
+                                                       '(default: .aoc/profiles/dayN-partM.folded)')
+
+    # memory command
+    parser_memory = subparsers.add_parser('memory', help='Trace memory allocations of a solution')
+    parser_memory.add_argument('day', nargs='?', help='Day number (e.g., 1 or day1)')
+    parser_memory.add_argument('-p', '--part', type=int, choices=[1, 2], help='Part number')
+    parser_memory.add_argument('--test', action='store_true', help='Use test input instead of real input')
+    parser_memory.add_argument('--top', type=int, default=10, help='Allocation sites per phase (default: 10)')
+
+    # generate command
+    parser_generate = subparsers.add_parser('generate', help='Write a synthetic input file')
+    parser_generate.add_argument('day', nargs='?', help='Day number (e.g., 1 or day1)')
+    parser_generate.add_argument('--size', type=int, required=True,
+                                 help='Rotations (day 1), range width (day 2) or banks (day 3)')
+    parser_generate.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    parser_generate.add_argument('--width', type=int, help='Digits per bank (day 3, default: 100)')
+    parser_generate.add_argument('-o', '--output', help='Output file (default: dayN/generated-SIZE.txt)')
+
+    # scale command
+    parser_scale = subparsers.add_parser('scale', help='Benchmark a solution on growing generated inputs')
+    parser_scale.add_argument('day', nargs='?', help='Day number (e.g., 1 or day1)')
+    parser_scale.add_argument('-p', '--part', type=int, choices=[1, 2], help='Part number (default: both)')
+    parser_scale.add_argument('--all', action='store_true', help='Every initialized day with a generator')
+    parser_scale.add_argument('--sizes', help='Comma-separated sizes (default: per-day presets)')
+    parser_scale.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    parser_scale.add_argument('--width', type=int,
+                              help='Digits per bank (day 3, default: 100; with --all only day 3 runs)')
+    parser_scale.add_argument('--repeat', type=int, default=3, help='Timed runs per size, best counts (default: 3)')
+    parser_scale.add_argument('--max-seconds', type=float, default=10.0,
+                              help='Skip larger sizes once one takes longer than this (default: 10)')
+
+    # watch command
+    parser_watch = subparsers.add_parser('watch', help='Rerun a day on every save, in one warm process')
+    parser_watch.add_argument('day', nargs='?', help='Day number (e.g., 1 or day1)')
+    parser_watch.add_argument('-p', '--part', type=int, choices=[1, 2], help='Part number (default: both)')
+    parser_watch.add_argument('--interval', type=float, default=0.5, help='Seconds between polls (default: 0.5)')
 
     args = parser.parse_args()
 
+    if args.startup_profile:
+        sys.exit(startup_profile([arg for arg in sys.argv[1:] if arg != '--startup-profile']))
+
     if not args.command:
         parser.print_help()
         sys.exit(1)
@@ -367,12 +1103,30 @@ def main():
     # Route to command handlers
     if args.command == 'init':
         cmd_init(args)
+    elif args.command == 'fetch':
+        cmd_fetch(args)
+    elif args.command == 'arm':
+        cmd_arm(args)
     elif args.command == 'test':
         cmd_test(args)
     elif args.command == 'run':
         cmd_run(args)
     elif args.command == 'submit':
         cmd_submit(args)
+    elif args.command == 'bench':
+        cmd_bench(args)
+    elif args.command == 'compare':
+        cmd_compare(args)
+    elif args.command == 'profile':
+        cmd_profile(args)
+    elif args.command == 'memory':
+        cmd_memory(args)
+    elif args.command == 'generate':
+        cmd_generate(args)
+    elif args.command == 'scale':
+        cmd_scale(args)
+    elif args.command == 'watch':
+        cmd_watch(args)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,118 @@
+"""
+Advent of Code 2025 - Day 1 vectorised dial
+
+NumPy engine for both parts. The whole file is parsed into one signed step
+array, and every dial position comes out of a single cumulative sum. step1.py
+and step2.py solve through it when numpy is installed.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; without it the step files use their per-line loop
+    np = None
+
+DIAL_SIZE = 100
+DIAL_START = 50
+
+
+def parse_steps(raw: bytes):
+    """
+    Parse rotations like 'L68' / 'R48' into signed steps without looping over rotations.
+
+    Args:
+        raw: Raw input file contents
+
+    Returns:
+        numpy.ndarray: int64 steps, negative for L and positive for R
+
+    Raises:
+        ValueError: If a rotation has no digits
+    """
+    buf = np.frombuffer(raw, dtype=np.uint8)
+
+    # every non-digit byte is either a rotation letter or a line separator, and each step count
+    # is the run of digits between a letter and the next non-digit byte
+    separators = np.flatnonzero((buf < ord('0')) | (buf > ord('9')))
+    kinds = buf[separators]
+    letters = np.flatnonzero((kinds == ord('L')) | (kinds == ord('R')))
+    if len(letters) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    starts = separators[letters]
+    run_ends = np.append(separators, len(buf))[letters + 1]
+    digit_counts = run_ends - starts - 1
+    if digit_counts.min() == 0:
+        raise ValueError("Every rotation needs a step count")
+
+    # build the numbers from their last digit backwards, one column of digits per pass
+    steps = np.zeros(len(starts), dtype=np.int64)
+    place = 1
+    for offset in range(1, int(digit_counts.max()) + 1):
+        digits = buf[run_ends - offset].astype(np.int64) - ord('0')
+        steps += np.where(offset <= digit_counts, digits, 0) * place
+        place *= 10
+
+    return np.where(kinds[letters] == ord('L'), -steps, steps)
+
+
+def read_steps(filename):
+    """Read input file and return signed steps."""
+    with open(filename, 'rb') as f:
+        return parse_steps(f.read())
+
+
+def steps_from_lines(lines):
+    """Signed steps for rotation lines as returned by the step files' read_input()."""
+    return parse_steps('\n'.join(lines).encode())
+
+
+def count_landings(steps) -> int:
+    """
+    Part 1: count rotations that leave the dial at 0.
+
+    Args:
+        steps: Signed step array
+
+    Returns:
+        int: Number of rotations ending on 0
+    """
+    positions = (DIAL_START + np.cumsum(steps)) % DIAL_SIZE
+    return int(np.count_nonzero(positions == 0))
+
+
+def count_crossings(steps) -> int:
+    """
+    Part 2: count every click that passes the dial through 0.
+
+    Args:
+        steps: Signed step array
+
+    Returns:
+        int: Number of times the dial points at 0
+    """
+    # without the wrap-around, a rotation from a to b passes 0 once per multiple of 100 it covers:
+    # going right that's (a, b], going left it's [b, a), hence the -1 shift on the left-hand case.
+    if len(steps) == 0:
+        return 0
+    after = DIAL_START + np.cumsum(steps)
+    before = np.concatenate(([DIAL_START], after[:-1]))
+
+    right = (after // DIAL_SIZE) - (before // DIAL_SIZE)
+    left = ((before - 1) // DIAL_SIZE) - ((after - 1) // DIAL_SIZE)
+
+    return int(np.where(steps > 0, right, left).sum())
+
+
+if __name__ == "__main__":
+    import sys
+
+    count = count_crossings if '--part2' in sys.argv else count_landings
+
+    if '--test' in sys.argv:
+        # Test with example input
+        test_result = count(read_steps('test-input.txt'))
+        print(f"Test result: {test_result}")
+    else:
+        # Run with real input
+        result = count(read_steps('input.txt'))
+        print(f"Result: {result}")
@@ -0,0 +1,173 @@
+"""
+Advent of Code 2025 - Day 1 parallel map-reduce
+
+Rotations are additions mod 100, so a chunk of rotations can be summarised
+without knowing where the dial starts: its net offset, plus the zero landings
+and zero crossings it would produce from each of the 100 starting positions.
+Summaries combine associatively, so chunks of a large file are summarised in a
+process pool and folded together in order. step1.py and step2.py use it through
+solve_file(), which the harness calls for inputs over its streaming threshold.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+
+DIAL_SIZE = 100
+DIAL_START = 50
+CHUNKS_PER_WORKER = 4
+
+
+def empty_summary():
+    """Summary of no rotations: no offset, no landings, no crossings."""
+    return (0, [0] * DIAL_SIZE, [0] * DIAL_SIZE)
+
+
+def summarize(lines):
+    """
+    Summarise a run of rotations for every starting position at once.
+
+    Args:
+        lines: Iterable of rotation lines (bytes or str), e.g. b'L68'
+
+    Returns:
+        tuple: (offset, landings, crossings) where landings[s] and crossings[s]
+            are the part 1 and part 2 counts when starting at position s
+    """
+    # track the unwrapped position q as if we started at 0. starting at s instead shifts every
+    # position by s, and floor((s + q) / 100) = q // 100 + [q % 100 >= 100 - s], so the start only
+    # matters through the residues of q. we keep a signed histogram of those residues and resolve
+    # all 100 starts at the end.
+    position = 0
+    base_crossings = 0
+    residues = [0] * DIAL_SIZE
+    crossing_residues = [0] * DIAL_SIZE
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        steps = int(line[1:])
+        if line[0] in ('R', ord('R')):
+            moved = position + steps
+            base_crossings += moved // DIAL_SIZE - position // DIAL_SIZE
+            crossing_residues[moved % DIAL_SIZE] += 1
+            crossing_residues[position % DIAL_SIZE] -= 1
+        else:
+            moved = position - steps
+            base_crossings += (position - 1) // DIAL_SIZE - (moved - 1) // DIAL_SIZE
+            crossing_residues[(position - 1) % DIAL_SIZE] += 1
+            crossing_residues[(moved - 1) % DIAL_SIZE] -= 1
+
+        position = moved
+        residues[position % DIAL_SIZE] += 1
+
+    landings = [residues[-start % DIAL_SIZE] for start in range(DIAL_SIZE)]
+    crossings = [base_crossings + sum(crossing_residues[DIAL_SIZE - start:]) for start in range(DIAL_SIZE)]
+
+    return (position % DIAL_SIZE, landings, crossings)
+
+
+def combine(first, second):
+    """
+    Summary of running `first` and then `second`.
+
+    Args:
+        first: Summary of the earlier rotations
+        second: Summary of the rotations right after them
+
+    Returns:
+        tuple: Combined summary
+    """
+    first_offset, first_landings, first_crossings = first
+    second_offset, second_landings, second_crossings = second
+
+    # the second chunk starts wherever the first one left the dial
+    landings = [first_landings[start] + second_landings[(start + first_offset) % DIAL_SIZE]
+                for start in range(DIAL_SIZE)]
+    crossings = [first_crossings[start] + second_crossings[(start + first_offset) % DIAL_SIZE]
+                 for start in range(DIAL_SIZE)]
+
+    return ((first_offset + second_offset) % DIAL_SIZE, landings, crossings)
+
+
+def chunk_boundaries(filename, chunks):
+    """
+    Split a file into byte ranges that start and end on line boundaries.
+
+    Args:
+        filename: Input file path
+        chunks: Number of ranges to aim for
+
+    Returns:
+        list: (start, end) byte offsets, in file order
+    """
+    size = os.path.getsize(filename)
+    offsets = [0]
+
+    with open(filename, 'rb') as f:
+        for index in range(1, chunks):
+            f.seek(max(size * index // chunks, offsets[-1]))
+            f.readline()  # finish the line we landed in
+            offsets.append(min(f.tell(), size))
+
+    offsets.append(size)
+    return [(start, end) for start, end in zip(offsets, offsets[1:]) if end > start]
+
+
+def summarize_range(filename, start, end):
+    """Summarise the rotations stored in bytes [start, end) of a file."""
+    def lines():
+        remaining = end - start
+        with open(filename, 'rb') as f:
+            f.seek(start)
+            for line in f:
+                yield line
+                remaining -= len(line)
+                if remaining <= 0:
+                    break
+
+    return summarize(lines())
+
+
+def solve_file(filename, workers=None):
+    """
+    Solve both parts of Day 1 across a process pool.
+
+    Args:
+        filename: Input file path
+        workers: Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        tuple: (part 1 answer, part 2 answer)
+    """
+    workers = workers or os.cpu_count() or 1
+    ranges = chunk_boundaries(filename, workers * CHUNKS_PER_WORKER)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        summaries = executor.map(summarize_range,
+                                 [filename] * len(ranges),
+                                 [start for start, _ in ranges],
+                                 [end for _, end in ranges])
+        _, landings, crossings = reduce(combine, summaries, empty_summary())
+
+    return landings[DIAL_START], crossings[DIAL_START]
+
+
+if __name__ == "__main__":
+    import sys
+
+    workers = None
+    if '--workers' in sys.argv:
+        workers = int(sys.argv[sys.argv.index('--workers') + 1])
+    index = 1 if '--part2' in sys.argv else 0
+
+    if '--test' in sys.argv:
+        # Test with example input
+        test_result = solve_file('test-input.txt', workers)[index]
+        print(f"Test result: {test_result}")
+    else:
+        # Run with real input
+        result = solve_file('input.txt', workers)[index]
+        print(f"Result: {result}")
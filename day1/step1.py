@@ -4,19 +4,24 @@ Advent of Code 2025 - Day 1 Part 1
 See step1.md for problem description.
 """
 
+from dial import np, count_landings, steps_from_lines
+from parallel import solve_file as solve_file_in_parallel
+
 def read_input(filename):
     """Read input file and return processed data."""
     with open(filename, 'r') as f:
         lines = f.read().strip().split('\n')
     return lines
 
+def parse_step(line):
+    """Turn a rotation like 'L68' into a signed step count (left turns negative)."""
+    steps = int(line[1:])
+    return -steps if line[0] == 'L' else steps
 
-def move(ticker, direction, steps):
-    if direction == 'L':
-        ticker -= steps
-    else:
-        ticker += steps
-    return ticker % 100
+def read_parsed(filename):
+    """Read input file as signed step counts for solve_parsed()."""
+    from array import array
+    return array('q', map(parse_step, read_input(filename)))
 
 def solve(data):
     """
@@ -25,25 +30,59 @@ def solve(data):
     Args:
         data: Processed input data
 
+    Returns:
+        Solution answer
+    """
+    # the whole input is in memory here, so numpy can take it in one go when it is installed
+    if np is not None:
+        return count_landings(steps_from_lines(data))
+    return solve_stream(data)
+
+def solve_stream(records):
+    """
+    Solve the puzzle one rotation at a time, in constant memory.
+
+    Args:
+        records: Iterable of rotation lines (str)
+
+    Returns:
+        Solution answer
+    """
+    return solve_parsed(map(parse_step, records))
+
+def solve_file(filename):
+    """
+    Solve the puzzle from a large input file, split into chunks across a process pool.
+
+    Args:
+        filename: Input file path
+
+    Returns:
+        Solution answer
+    """
+    return solve_file_in_parallel(filename)[0]
+
+def solve_parsed(steps):
+    """
+    Solve the puzzle from signed step counts (see parse_step()).
+
+    Args:
+        steps: Iterable of ints, negative for left turns
+
     Returns:
         Solution answer
     """
     ticker = 50
     count = 0
 
-    for line in data:
-        direction = line[0]
-        steps = int(line[1:])
-
-        ticker = move(ticker, direction, steps)
+    for step in steps:
+        ticker = (ticker + step) % 100
 
         if ticker == 0:
             count += 1
 
     return count
 
-
-
 if __name__ == "__main__":
     import sys
 
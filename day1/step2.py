@@ -6,12 +6,25 @@ See step2.md for problem description.
 
 import math
 
+from dial import np, count_crossings, steps_from_lines
+from parallel import solve_file as solve_file_in_parallel
+
 def read_input(filename):
     """Read input file and return processed data."""
     with open(filename, 'r') as f:
         lines = f.read().strip().split('\n')
     return lines
 
+def parse_step(line):
+    """Turn a rotation like 'L68' into a signed step count (left turns negative)."""
+    steps = int(line[1:])
+    return -steps if line[0] == 'L' else steps
+
+def read_parsed(filename):
+    """Read input file as signed step counts for solve_parsed()."""
+    from array import array
+    return array('q', map(parse_step, read_input(filename)))
+
 def solve(data):
     """
     Solve the puzzle.
@@ -19,18 +32,55 @@ def solve(data):
     Args:
         data: Processed input data
 
+    Returns:
+        Solution answer
+    """
+    # the whole input is in memory here, so numpy can take it in one go when it is installed
+    if np is not None:
+        return count_crossings(steps_from_lines(data))
+    return solve_stream(data)
+
+def solve_stream(records):
+    """
+    Solve the puzzle one rotation at a time, in constant memory.
+
+    Args:
+        records: Iterable of rotation lines (str)
+
+    Returns:
+        Solution answer
+    """
+    return solve_parsed(map(parse_step, records))
+
+def solve_file(filename):
+    """
+    Solve the puzzle from a large input file, split into chunks across a process pool.
+
+    Args:
+        filename: Input file path
+
+    Returns:
+        Solution answer
+    """
+    return solve_file_in_parallel(filename)[1]
+
+def solve_parsed(steps):
+    """
+    Solve the puzzle from signed step counts (see parse_step()).
+
+    Args:
+        steps: Iterable of ints, negative for left turns
+
     Returns:
         Solution answer
     """
     ticker = 50  # current dial position
     count = 0    # total times the dial points at 0
 
-    for line in data:
-        direction = line[0]
-        steps = int(line[1:])
+    for step in steps:
         start = ticker
 
-        if direction == 'R':
+        if step >= 0:
             # distance to next 0 when moving right
             dist = (100 - start) % 100
         else:
@@ -41,15 +91,12 @@ def solve(data):
         if dist == 0:
             dist = 100
 
-        if steps < dist:
+        if abs(step) < dist:
             hits = 0
         else:
-            hits = 1 + (steps - dist) // 100
+            hits = 1 + (abs(step) - dist) // 100
 
-        if direction == 'R':
-            ticker = (start + steps) % 100
-        else:
-            ticker = (start - steps) % 100
+        ticker = (start + step) % 100
 
         count += hits
 
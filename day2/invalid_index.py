@@ -0,0 +1,250 @@
+"""
+Advent of Code 2025 - Day 2 invalid ID index
+
+Sorted list of every invalid ID up to a fixed number of digits, with prefix sums,
+so a batch of ranges can be answered with two bisects per range. The index is
+built once, saved next to this file, and memory-mapped on later runs.
+
+This is a separate batch API for answering many range queries against the same
+rules; step1.py and step2.py don't use it. Their closed-form sums need no index
+and cover IDs up to 10^18, past what an index of MAX_SUPPORTED_DIGITS can hold.
+"""
+
+import bisect
+import mmap
+import os
+import struct
+from array import array
+
+INDEX_MAGIC = b'AOC2IDX1'
+INDEX_HEADER = struct.Struct('=8sBBxxxxxxQ')  # magic, part, max digits, number of IDs
+DEFAULT_MAX_DIGITS = 10
+MAX_SUPPORTED_DIGITS = 12  # prefix sums stop fitting in a signed 64-bit int past this
+
+
+def read_input(filename):
+    """Read input file and return processed data."""
+    with open(filename, 'r') as f:
+        lines = f.read().strip().split(',')
+    return lines
+
+
+def invalid_ids(part: int, max_digits: int):
+    # yields the invalid IDs in increasing order. part 1 only allows a block repeated exactly twice,
+    # part 2 allows any number of repeats, so a single ID can come from several periods there.
+    for digits in range(2, max_digits + 1):
+        if part == 1:
+            periods = [digits // 2] if digits % 2 == 0 else []
+        else:
+            periods = [period for period in range(1, digits) if digits % period == 0]
+
+        found = set()
+        for period in periods:
+            multiplier = (10 ** digits - 1) // (10 ** period - 1)
+            for block in range(10 ** (period - 1), 10 ** period):
+                found.add(block * multiplier)
+
+        yield from sorted(found)
+
+
+class InvalidIdIndex:
+    """Sorted invalid IDs plus prefix sums, backed by arrays or a memory-mapped file."""
+
+    def __init__(self, part, max_digits, ids, prefix, mapping=None):
+        """
+        Wrap already built index data.
+
+        Args:
+            part: Part number (1 or 2) whose rule the IDs follow
+            max_digits: Largest ID length covered by the index
+            ids: Sorted sequence of invalid IDs
+            prefix: prefix[i] is the sum of the first i IDs
+            mapping: Open mmap backing ids and prefix, if any
+        """
+        self.part = part
+        self.max_digits = max_digits
+        self.limit = 10 ** max_digits - 1
+        self.ids = ids
+        self.prefix = prefix
+        self._mapping = mapping
+
+    @classmethod
+    def build(cls, part, max_digits=DEFAULT_MAX_DIGITS):
+        """
+        Build the index in memory.
+
+        Args:
+            part: Part number (1 or 2)
+            max_digits: Largest ID length to cover
+
+        Returns:
+            InvalidIdIndex: The built index
+
+        Raises:
+            ValueError: If part or max_digits is out of range
+        """
+        if part not in (1, 2):
+            raise ValueError(f"Part must be 1 or 2, got {part}")
+        if not (1 <= max_digits <= MAX_SUPPORTED_DIGITS):
+            raise ValueError(f"max_digits must be between 1 and {MAX_SUPPORTED_DIGITS}, got {max_digits}")
+
+        ids = array('q', invalid_ids(part, max_digits))
+        prefix = array('q', [0])
+        running = 0
+        for invalid_id in ids:
+            running += invalid_id
+            prefix.append(running)
+
+        return cls(part, max_digits, ids, prefix)
+
+    def save(self, path):
+        """
+        Write the index to disk in the format load() maps.
+
+        Args:
+            path: Destination file path
+        """
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(INDEX_HEADER.pack(INDEX_MAGIC, self.part, self.max_digits, len(self.ids)))
+            f.write(bytes(memoryview(self.ids).cast('B')))
+            f.write(bytes(memoryview(self.prefix).cast('B')))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Memory-map an index previously written by save().
+
+        Args:
+            path: Index file path
+
+        Returns:
+            InvalidIdIndex: Index whose arrays are views into the mapped file
+
+        Raises:
+            ValueError: If the file is not a valid index
+        """
+        with open(path, 'rb') as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(mapping) < INDEX_HEADER.size:
+            mapping.close()
+            raise ValueError(f"{path} is not a Day 2 index")
+
+        magic, part, max_digits, count = INDEX_HEADER.unpack_from(mapping)
+        ids_start = INDEX_HEADER.size
+        prefix_start = ids_start + 8 * count
+        if magic != INDEX_MAGIC or len(mapping) != prefix_start + 8 * (count + 1):
+            mapping.close()
+            raise ValueError(f"{path} is not a Day 2 index")
+
+        view = memoryview(mapping)
+        ids = view[ids_start:prefix_start].cast('q')
+        prefix = view[prefix_start:].cast('q')
+        return cls(part, max_digits, ids, prefix, mapping)
+
+    @classmethod
+    def open(cls, part, max_digits=DEFAULT_MAX_DIGITS, path=None):
+        """
+        Load the cached index for a part, building and saving it first if needed.
+
+        Args:
+            part: Part number (1 or 2)
+            max_digits: Largest ID length to cover
+            path: Index file path (defaults to a file next to this module)
+
+        Returns:
+            InvalidIdIndex: Memory-mapped index
+        """
+        if path is None:
+            path = default_index_path(part, max_digits)
+
+        if os.path.exists(path):
+            try:
+                index = cls.load(path)
+                if index.part == part and index.max_digits == max_digits:
+                    return index
+                index.close()
+            except ValueError:
+                pass
+
+        cls.build(part, max_digits).save(path)
+        return cls.load(path)
+
+    def range_sum(self, low, high):
+        """
+        Sum every invalid ID in [low, high].
+
+        Args:
+            low: First ID of the range
+            high: Last ID of the range
+
+        Returns:
+            int: Sum of the invalid IDs in the range (0 if low > high)
+
+        Raises:
+            ValueError: If the range goes past the largest indexed ID
+        """
+        if low > high:
+            return 0
+        if high > self.limit:
+            raise ValueError(f"Range end {high} is past the index limit {self.limit}; rebuild with more digits")
+        start = bisect.bisect_left(self.ids, low)
+        end = bisect.bisect_right(self.ids, high)
+        return self.prefix[end] - self.prefix[start]
+
+    def close(self):
+        """Release the memory mapping, if the index has one."""
+        if self._mapping is not None:
+            self.ids.release()
+            self.prefix.release()
+            self._mapping.close()
+            self._mapping = None
+
+
+def default_index_path(part, max_digits):
+    """Return where the index for a part and digit count is cached."""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(directory, f"invalid-ids-part{part}-{max_digits}.idx")
+
+
+def solve(data, part=1, index=None):
+    """
+    Solve either part using the precomputed index.
+
+    Args:
+        data: Processed input data
+        part: Part number (1 or 2) selecting the invalid ID rule
+        index: Already opened InvalidIdIndex to reuse across batches
+
+    Returns:
+        Solution answer
+    """
+    if index is None:
+        index = InvalidIdIndex.open(part)
+
+    acc = 0
+
+    for pair in data:
+        pair0, pair1 = pair.split('-')
+        acc += index.range_sum(int(pair0), int(pair1))
+
+    return acc
+
+
+if __name__ == "__main__":
+    import sys
+
+    part = 2 if '--part2' in sys.argv else 1
+
+    if '--test' in sys.argv:
+        # Test with example input
+        test_data = read_input('test-input.txt')
+        test_result = solve(test_data, part)
+        print(f"Test result: {test_result}")
+    else:
+        # Run with real input
+        real_data = read_input('input.txt')
+        result = solve(real_data, part)
+        print(f"Result: {result}")
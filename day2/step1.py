@@ -10,6 +10,15 @@ def read_input(filename):
         lines = f.read().strip().split(',')
     return lines
 
+def parse_bounds(pairs):
+    """Turn ranges like '11-22' into flat low, high, low, high, ... ints."""
+    return [int(bound) for pair in pairs for bound in pair.split('-')]
+
+def read_parsed(filename):
+    """Read input file as flat range bounds for solve_parsed()."""
+    from array import array
+    return array('q', parse_bounds(read_input(filename)))
+
 def repeated_number(number: str) -> int:
     # if the first half of the number is the same as the second half, return the number, otherwise return 0
     if len(number) % 2 != 0:
@@ -19,6 +28,26 @@ def repeated_number(number: str) -> int:
         return int(number)
     return 0
 
+def sum_invalid_ids(low: int, high: int) -> int:
+    # every invalid ID with 2k digits is some k-digit half h written twice, i.e. h * (10^k + 1).
+    # so for each even length we just need the range of halves that lands inside [low, high],
+    # and the sum of those IDs is an arithmetic series.
+    acc = 0
+    half_digits = 1
+
+    while 10 ** (2 * half_digits - 1) <= high:
+        multiplier = 10 ** half_digits + 1
+
+        first_half = max(10 ** (half_digits - 1), -(-low // multiplier))
+        last_half = min(10 ** half_digits - 1, high // multiplier)
+
+        if first_half <= last_half:
+            acc += multiplier * (first_half + last_half) * (last_half - first_half + 1) // 2
+
+        half_digits += 1
+
+    return acc
+
 def solve(data):
     """
     Solve the puzzle.
@@ -29,19 +58,19 @@ def solve(data):
     Returns:
         Solution answer
     """
+    return solve_parsed(parse_bounds(data))
 
-    acc = 0
-
-    for pair in data:
-        pair0, pair1 = pair.split('-')
-
-        pair0 = int(pair0)
-        pair1 = int(pair1)
+def solve_parsed(bounds):
+    """
+    Solve the puzzle from flat range bounds (see parse_bounds()).
 
-        for i in range(pair0, pair1 + 1):
-            acc += repeated_number(str(i))
+    Args:
+        bounds: Sequence of ints, alternating range start and end
 
-    return acc
+    Returns:
+        Solution answer
+    """
+    return sum(sum_invalid_ids(bounds[i], bounds[i + 1]) for i in range(0, len(bounds), 2))
 
 
 if __name__ == "__main__":
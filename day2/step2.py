@@ -10,6 +10,15 @@ def read_input(filename):
         lines = f.read().strip().split(',')
     return lines
 
+def parse_bounds(pairs):
+    """Turn ranges like '11-22' into flat low, high, low, high, ... ints."""
+    return [int(bound) for pair in pairs for bound in pair.split('-')]
+
+def read_parsed(filename):
+    """Read input file as flat range bounds for solve_parsed()."""
+    from array import array
+    return array('q', parse_bounds(read_input(filename)))
+
 def repeated_number(number: str) -> int:
     # Alright, now lets think about this. We need to check if the number is made of some sequence of digits repeated at least twice.
 
@@ -26,6 +35,52 @@ def repeated_number(number: str) -> int:
 
     return 0
 
+def mobius(n: int) -> int:
+    # 0 if n has a squared prime factor, otherwise (-1)^(number of prime factors)
+    result = 1
+    factor = 2
+    while factor * factor <= n:
+        if n % factor == 0:
+            n //= factor
+            if n % factor == 0:
+                return 0
+            result = -result
+        factor += 1
+    if n > 1:
+        result = -result
+    return result
+
+def sum_periodic(low: int, high: int, digits: int, period: int) -> int:
+    # sum of every `digits`-long number in [low, high] built from a `period`-long block repeated.
+    # those are exactly block * (10^(digits - period) + ... + 10^period + 1), so it's an arithmetic series over the block.
+    multiplier = (10 ** digits - 1) // (10 ** period - 1)
+
+    first_block = max(10 ** (period - 1), -(-low // multiplier))
+    last_block = min(10 ** period - 1, high // multiplier)
+
+    if first_block > last_block:
+        return 0
+    return multiplier * (first_block + last_block) * (last_block - first_block + 1) // 2
+
+def sum_invalid_ids(low: int, high: int) -> int:
+    # a number like 111111 repeats with period 1, 2 and 3, so summing every period would count it three times.
+    # group numbers by their smallest (primitive) period instead: the ones with primitive period equal to the
+    # full length are the valid IDs, and by mobius inversion those sum to sum over p | d of mu(d / p) * S(p).
+    # everything periodic is S(d) (all d-digit numbers), so the invalid ones are minus the p < d terms.
+    acc = 0
+    digits = 2
+
+    while 10 ** (digits - 1) <= high:
+        for period in range(1, digits):
+            if digits % period != 0:
+                continue
+            weight = mobius(digits // period)
+            if weight != 0:
+                acc -= weight * sum_periodic(low, high, digits, period)
+        digits += 1
+
+    return acc
+
 def solve(data):
     """
     Solve the puzzle.
@@ -36,19 +91,19 @@ def solve(data):
     Returns:
         Solution answer
     """
+    return solve_parsed(parse_bounds(data))
 
-    acc = 0
-
-    for pair in data:
-        pair0, pair1 = pair.split('-')
-
-        pair0 = int(pair0)
-        pair1 = int(pair1)
+def solve_parsed(bounds):
+    """
+    Solve the puzzle from flat range bounds (see parse_bounds()).
 
-        for i in range(pair0, pair1 + 1):
-            acc += repeated_number(str(i))
+    Args:
+        bounds: Sequence of ints, alternating range start and end
 
-    return acc
+    Returns:
+        Solution answer
+    """
+    return sum(sum_invalid_ids(bounds[i], bounds[i + 1]) for i in range(0, len(bounds), 2))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,140 @@
+"""
+Advent of Code 2025 - Day 3 shared battery selection
+
+Both parts pick k batteries from a bank, keeping their order, to make the largest
+possible joltage. This is the same greedy for any k.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; without it every bank goes through the per-line path
+    np = None
+
+INT_CHUNK_DIGITS = 4000  # stays under Python's default int/str conversion limit
+
+# the batched path costs k passes over the whole n x width grid, against one pass per bank for the
+# stack, so it only pays off for many banks with a small k * width (measured on 100-1000 digit banks)
+BATCH_MIN_BANKS = 32
+BATCH_MAX_WORK = 50_000  # k * width
+
+
+def digits_to_int(digits: bytes) -> int:
+    # int() refuses to parse more than ~4300 digits at once, so long selections are converted in chunks
+    if len(digits) <= INT_CHUNK_DIGITS:
+        return int(digits)
+
+    value = 0
+    for start in range(0, len(digits), INT_CHUNK_DIGITS):
+        chunk = digits[start:start + INT_CHUNK_DIGITS]
+        value = value * 10 ** len(chunk) + int(chunk)
+    return value
+
+
+def select_batteries(bank: bytes, k: int) -> bytes:
+    """
+    Pick the k digits of a bank that form the largest number, keeping their order.
+
+    Args:
+        bank: ASCII digits of one bank
+        k: Number of batteries to turn on
+
+    Returns:
+        bytes: The k selected ASCII digits
+
+    Raises:
+        ValueError: If the bank has fewer than k batteries
+    """
+    to_drop = len(bank) - k
+    if to_drop < 0:
+        raise ValueError(f"Bank has {len(bank)} batteries, cannot turn on {k}")
+
+    # monotonic stack: a smaller digit is dropped as soon as a bigger one shows up after it,
+    # as long as we can still afford to drop digits. every digit is pushed and popped at most once.
+    stack = bytearray()
+    for digit in bank:
+        while to_drop and stack and stack[-1] < digit:
+            stack.pop()
+            to_drop -= 1
+        stack.append(digit)
+
+    del stack[k:]
+    return bytes(stack)
+
+
+def maximum_joltage(bank: bytes, k: int) -> int:
+    """
+    Largest joltage a bank can produce with k batteries on.
+
+    Args:
+        bank: ASCII digits of one bank
+        k: Number of batteries to turn on
+
+    Returns:
+        int: The joltage
+    """
+    return digits_to_int(select_batteries(bank, k))
+
+
+def total_joltage(banks, k: int) -> int:
+    """
+    Sum the maximum joltage of every bank.
+
+    Many equal-length banks with a small k * width are solved together with
+    numpy when it is installed; anything else (a few banks, long banks or a
+    large k, ragged input, no numpy) goes one bank at a time.
+
+    Args:
+        banks: List of banks as ASCII digit bytes
+        k: Number of batteries to turn on in each bank
+
+    Returns:
+        int: Total joltage
+    """
+    if (np is not None and len(banks) >= BATCH_MIN_BANKS and len(set(map(len, banks))) == 1
+            and k * len(banks[0]) <= BATCH_MAX_WORK):
+        return total_joltage_batched(banks, k)
+    return sum(maximum_joltage(bank, k) for bank in banks)
+
+
+def total_joltage_batched(banks, k: int) -> int:
+    """
+    Sum the maximum joltage of equal-length banks with numpy.
+
+    All banks are loaded into one 2-D uint8 array and the k greedy picks are done
+    as row-wise argmax reductions, each one masked to the window that bank may
+    still choose from.
+
+    Args:
+        banks: List of equal-length banks as ASCII digit bytes
+        k: Number of batteries to turn on in each bank
+
+    Returns:
+        int: Total joltage
+
+    Raises:
+        ValueError: If the banks are shorter than k
+    """
+    width = len(banks[0])
+    if width < k:
+        raise ValueError(f"Bank has {width} batteries, cannot turn on {k}")
+
+    grid = np.frombuffer(b''.join(banks), dtype=np.uint8).reshape(len(banks), width)
+    rows = np.arange(len(banks))
+    start = np.zeros(len(banks), dtype=np.intp)
+
+    # adding up column by column keeps the total exact for any k, the per-column sums are small
+    total = 0
+    for battery_index in range(k):
+        # pick i may use anything from just after pick i-1 up to where enough batteries are left
+        low = int(start.min())
+        high = width - k + battery_index + 1
+        window = grid[:, low:high]
+
+        # masked-out cells become 0, which is below every ASCII digit, and argmax keeps the earliest max
+        allowed = np.arange(low, high) >= start[:, None]
+        picked = np.where(allowed, window, 0).argmax(axis=1) + low
+
+        total = total * 10 + int((grid[rows, picked] - ord('0')).sum(dtype=np.int64))
+        start = picked + 1
+
+    return total
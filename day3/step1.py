@@ -4,35 +4,16 @@ Advent of Code 2025 - Day 3 Part 1
 See step1.md for problem description.
 """
 
+from batteries import maximum_joltage, total_joltage
+
 def read_input(filename):
     """Read input file and return processed data."""
-    with open(filename, 'r') as f:
-        lines = f.read().strip().split('\n')
+    with open(filename, 'rb') as f:
+        lines = f.read().strip().split(b'\n')
     return lines
 
-def maximum_power(number: str) -> int:
-    # find the largest digit, earliest, and then find the largest digit after that.
-
-    max_digit = 0
-    max_digit_index = 0
-
-    for i in range(len(number) - 1):
-        digit = int(number[i])
-        if digit > max_digit:
-            max_digit = digit
-            max_digit_index = i
-
-    # then find the largest digit after that
-    max_digit_after = 0
-    max_digit_after_index = 0
-    
-    for i in range(max_digit_index + 1, len(number)):
-        digit = int(number[i])
-        if digit > max_digit_after:
-            max_digit_after = digit
-            max_digit_after_index = i
-
-    return max_digit * 10 + max_digit_after
+def maximum_power(number: bytes) -> int:
+    return maximum_joltage(number, 2)
 
 
 def solve(data):
@@ -42,11 +23,25 @@ def solve(data):
     Args:
         data: Processed input data
 
+    Returns:
+        Solution answer
+    """
+    return total_joltage(data, 2)
+
+def solve_stream(records):
+    """
+    Solve the puzzle one bank at a time, in constant memory.
+
+    Args:
+        records: Iterable of bank lines (str or bytes)
+
     Returns:
         Solution answer
     """
     acc = 0
-    for line in data:
+    for line in records:
+        if isinstance(line, str):
+            line = line.encode()
         acc += maximum_power(line)
     return acc
 
@@ -4,32 +4,16 @@ Advent of Code 2025 - Day 3 Part 2
 See step2.md for problem description.
 """
 
+from batteries import maximum_joltage, total_joltage
+
 def read_input(filename):
     """Read input file and return processed data."""
-    with open(filename, 'r') as f:
-        lines = f.read().strip().split('\n')
+    with open(filename, 'rb') as f:
+        lines = f.read().strip().split(b'\n')
     return lines
 
-def maximum_power(number: str) -> int:
-    batteries_to_turn_on = 12
-
-    power = 0
-    index = 0
-
-    for battery_index in range(batteries_to_turn_on):
-        max_digit = 0
-        max_digit_index = 0
-
-        for test_index in range(index, len(number) - (batteries_to_turn_on - battery_index) + 1):
-            digit = int(number[test_index])
-            if digit > max_digit:
-                max_digit = digit
-                max_digit_index = test_index
-
-        power = 10 * power + max_digit
-        index = max_digit_index + 1
-
-    return power
+def maximum_power(number: bytes) -> int:
+    return maximum_joltage(number, 12)
 
 
 def solve(data):
@@ -39,11 +23,25 @@ def solve(data):
     Args:
         data: Processed input data
 
+    Returns:
+        Solution answer
+    """
+    return total_joltage(data, 12)
+
+def solve_stream(records):
+    """
+    Solve the puzzle one bank at a time, in constant memory.
+
+    Args:
+        records: Iterable of bank lines (str or bytes)
+
     Returns:
         Solution answer
     """
     acc = 0
-    for line in data:
+    for line in records:
+        if isinstance(line, str):
+            line = line.encode()
         acc += maximum_power(line)
     return acc
 
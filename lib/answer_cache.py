@@ -0,0 +1,154 @@
+"""
+Content-addressed cache of solution answers.
+
+An answer is stored under a hash of the solution source, every local module it
+imports (helpers next to it and lib/ modules, followed transitively), and the
+input bytes. If none of those changed, the answer can't have either.
+"""
+import ast
+import hashlib
+import json
+import os
+from datetime import datetime
+
+from lib.utils import state_path, file_sha256
+
+CACHE_FILE = 'answers.json'
+MAX_ENTRIES = 500
+
+
+def imported_modules(path):
+    """
+    Top-level names of every module a Python file imports.
+
+    Args:
+        path: Python source file
+
+    Returns:
+        set: Dotted module names, e.g. {'batteries', 'lib.fast_input'}
+    """
+    with open(path, 'rb') as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names.add(node.module)
+            # 'from lib import utils' imports the submodule lib.utils
+            names.update(f"{node.module}.{alias.name}" for alias in node.names)
+    return names
+
+
+def local_dependencies(script_path):
+    """
+    Local source files a solution depends on, followed transitively.
+
+    Args:
+        script_path: Path to dayN/stepM.py
+
+    Returns:
+        list: Sorted paths of the helper modules and lib/ modules it imports
+    """
+    day_dir = os.path.dirname(script_path)
+    found = set()
+    pending = [script_path]
+
+    while pending:
+        current = pending.pop()
+        for name in imported_modules(current):
+            parts = name.split('.')
+            if parts[0] == 'lib':
+                candidates = [os.path.join('lib', '__init__.py')]
+                if len(parts) > 1:
+                    candidates.append(os.path.join('lib', *parts[1:]) + '.py')
+            else:
+                candidates = [os.path.join(day_dir, *parts) + '.py']
+
+            for candidate in candidates:
+                if os.path.isfile(candidate) and candidate not in found:
+                    found.add(candidate)
+                    pending.append(candidate)
+
+    return sorted(found)
+
+
+def answer_key(script_path, input_file):
+    """
+    Cache key for running a solution on an input.
+
+    Args:
+        script_path: Path to dayN/stepM.py
+        input_file: Input file the solution reads
+
+    Returns:
+        str: Hex digest over the solution, its local imports and the input
+    """
+    digest = hashlib.sha256()
+    for path in [script_path] + local_dependencies(script_path):
+        digest.update(path.encode() + b'\0' + file_sha256(path).encode() + b'\n')
+    digest.update(b'input\0' + file_sha256(input_file).encode())
+    return digest.hexdigest()
+
+
+class AnswerCache:
+    """Size-bounded, least-recently-used answer store in .aoc/answers.json."""
+
+    def __init__(self, path=None, max_entries=MAX_ENTRIES):
+        """
+        Open the cache.
+
+        Args:
+            path: Cache file (defaults to .aoc/answers.json)
+            max_entries: Entries kept before the least recently used are evicted
+        """
+        self.path = path or state_path(CACHE_FILE)
+        self.max_entries = max_entries
+        try:
+            with open(self.path, 'r') as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.entries = {}
+
+    def get(self, key):
+        """
+        Look up an answer and mark it as recently used.
+
+        Args:
+            key: Key from answer_key()
+
+        Returns:
+            str: The cached answer, or None on a miss
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        entry['last_used'] = datetime.now().isoformat()
+        self._save()
+        return entry['answer']
+
+    def put(self, key, answer, **info):
+        """
+        Store an answer, evicting the least recently used entries past the limit.
+
+        Args:
+            key: Key from answer_key()
+            answer: Answer text
+            **info: Extra fields kept with the entry (day, part, ...)
+        """
+        now = datetime.now().isoformat()
+        self.entries[key] = dict(info, answer=str(answer), created=now, last_used=now)
+
+        if len(self.entries) > self.max_entries:
+            by_use = sorted(self.entries, key=lambda k: self.entries[k]['last_used'])
+            for stale in by_use[:len(self.entries) - self.max_entries]:
+                del self.entries[stale]
+
+        self._save()
+
+    def _save(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.entries, f, indent=1)
+        os.replace(tmp_path, self.path)
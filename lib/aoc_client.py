@@ -1,8 +1,17 @@
 """
 HTTP client for Advent of Code API.
 """
+import shutil
 import requests
-from time import time, sleep
+from time import sleep
+
+from lib.http_cache import HttpCache, session_identity
+from lib.submissions import SubmissionLimiter, lockout_seconds
+from lib.transport import Transport
+
+
+class OfflineError(requests.RequestException):
+    """A request in offline mode for something that isn't in the cache."""
 
 
 class AoCClient:
@@ -11,16 +20,75 @@ class AoCClient:
     BASE_URL = "https://adventofcode.com/2025"
     RATE_LIMIT_SECONDS = 3
 
-    def __init__(self, session_cookie):
+    def __init__(self, session_cookie, use_cache=True, offline=False, min_interval=0.0, pool_size=10,
+                 retries=3, connect_timeout=5.0, read_timeout=30.0):
         """
         Initialize AoC client with session cookie.
 
+        The client can be shared between threads: they reuse the transport's
+        keep-alive connections, and its limiter spaces out their requests.
+
         Args:
             session_cookie: Session cookie value from browser
+            use_cache: Keep downloaded pages and inputs in .aoc/http-cache/
+            offline: Serve downloads only from the cache, never the network
+            min_interval: Seconds between requests, across all threads
+            pool_size: Connections kept open for concurrent downloads
+            retries: Extra attempts after a connection error, timeout or 429/5xx reply
+            connect_timeout: Seconds to wait for a connection
+            read_timeout: Seconds to wait for the server to send data
         """
-        self.session = requests.Session()
+        self.transport = Transport(retries=retries, connect_timeout=connect_timeout, read_timeout=read_timeout,
+                                   pool_size=pool_size, min_interval=min_interval)
+        self.session = self.transport.session
         self.session.cookies.set('session', session_cookie)
-        self.last_submission_time = 0
+        self.submission_limiter = SubmissionLimiter(self.RATE_LIMIT_SECONDS)
+        self.cache = HttpCache(session_identity(session_cookie)) if use_cache or offline else None
+        self.offline = offline
+
+    def _get(self, url, immutable=False):
+        """
+        GET a page through the response cache.
+
+        Immutable resources are served from the cache once they have been
+        fetched. Anything else is revalidated with a conditional request, and a
+        304 reply reuses the cached body.
+
+        Args:
+            url: Page URL
+            immutable: The resource never changes once it exists
+
+        Returns:
+            str: Response body
+
+        Raises:
+            requests.HTTPError: If the request fails
+            OfflineError: In offline mode, if the URL isn't cached
+        """
+        entry = self.cache.get(url) if self.cache else None
+        if entry and (immutable or self.offline):
+            return entry['body']
+        if self.offline:
+            raise OfflineError(f"{url} is not cached (offline mode)")
+
+        headers = self.cache.validators(entry) if self.cache else {}
+        response = self.transport.request('GET', url, headers=headers)
+        if response.status_code == 304 and entry:
+            return entry['body']
+        response.raise_for_status()
+
+        if self.cache:
+            self.cache.put(url, response.text, response.headers)
+        return response.text
+
+    def warm_up(self):
+        """
+        Open a keep-alive connection to the server ahead of a time-critical request.
+
+        Raises:
+            requests.RequestException: If the server can't be reached
+        """
+        self.transport.request('HEAD', self.BASE_URL)
 
     def download_input(self, day):
         """
@@ -34,11 +102,41 @@ class AoCClient:
 
         Raises:
             requests.HTTPError: If download fails
+            OfflineError: In offline mode, if the input was never downloaded
+        """
+        # an input never changes once published, so it is only downloaded once
+        return self._get(f"{self.BASE_URL}/day/{day}/input", immutable=True)
+
+    def save_input(self, day, path):
+        """
+        Download puzzle input for a given day straight to a file.
+
+        The body is streamed to disk instead of being held in memory, which
+        matters for large inputs.
+
+        Args:
+            day: Day number (1-12)
+            path: File to write the input to
+
+        Raises:
+            requests.HTTPError: If download fails
+            OfflineError: In offline mode, if the input was never downloaded
         """
         url = f"{self.BASE_URL}/day/{day}/input"
-        response = self.session.get(url, timeout=30)
-        response.raise_for_status()
-        return response.text
+        cached = self.cache.cached_file(url) if self.cache else None
+
+        if cached is None:
+            if self.offline:
+                raise OfflineError(f"{url} is not cached (offline mode)")
+            if not self.cache:
+                self.transport.download(url, path)
+                return
+            download_path = self.cache.staging_path(url)
+            response = self.transport.download(url, download_path)
+            self.cache.put_file(url, download_path, response.headers)
+            cached = self.cache.cached_file(url)
+
+        shutil.copyfile(cached, path)
 
     def download_problem(self, day):
         """
@@ -52,11 +150,10 @@ class AoCClient:
 
         Raises:
             requests.HTTPError: If download fails
+            OfflineError: In offline mode, if the page was never downloaded
         """
-        url = f"{self.BASE_URL}/day/{day}"
-        response = self.session.get(url, timeout=30)
-        response.raise_for_status()
-        return response.text
+        # the page grows a Part 2 after Part 1 is solved, so it is revalidated
+        return self._get(f"{self.BASE_URL}/day/{day}")
 
     def submit_answer(self, day, part, answer):
         """
@@ -73,21 +170,25 @@ class AoCClient:
         Raises:
             requests.HTTPError: If submission fails
         """
-        # Rate limiting
-        elapsed = time() - self.last_submission_time
-        if elapsed < self.RATE_LIMIT_SECONDS:
-            wait_time = self.RATE_LIMIT_SECONDS - elapsed
+        # Rate limiting, shared with every other aoc.py process
+        wait_time = self.submission_limiter.reserve()
+        if wait_time > 0:
             print(f"Rate limiting: waiting {wait_time:.1f} seconds...")
             sleep(wait_time)
 
         url = f"{self.BASE_URL}/day/{day}/answer"
         data = {'level': str(part), 'answer': str(answer)}
-        response = self.session.post(
+        response = self.transport.request(
+            'POST',
             url,
             data=data,
             headers={'Content-Type': 'application/x-www-form-urlencoded'},
-            timeout=30
         )
-        self.last_submission_time = time()
         response.raise_for_status()
+
+        # a wrong or too-early answer locks submissions for a while; make
+        # every process wait that out instead of burning another attempt
+        lockout = lockout_seconds(response.text)
+        if lockout:
+            self.submission_limiter.block_for(lockout)
         return response.text
@@ -0,0 +1,138 @@
+"""
+Benchmarking helpers for solution files.
+"""
+import statistics
+from time import perf_counter
+
+from lib.runner import load_solution, input_path
+
+
+def percentile(samples, fraction):
+    """
+    Linearly interpolated percentile of a list of samples.
+
+    Args:
+        samples: Non-empty list of numbers
+        fraction: Percentile as a fraction (0.95 for p95)
+
+    Returns:
+        float: The percentile value
+    """
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(samples):
+    """
+    Summary statistics for a list of timings.
+
+    Args:
+        samples: Non-empty list of durations in seconds
+
+    Returns:
+        dict: min, median, p95 and stdev, in seconds
+    """
+    return {
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'p95': percentile(samples, 0.95),
+        'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+def read_data(module, path, parsed=False):
+    """
+    Read a solution's input, optionally through the parsed-input cache.
+
+    Args:
+        module: Solution module
+        path: Input file
+        parsed: Use read_parsed()/solve_parsed() and the binary cache when the
+            solution defines them
+
+    Returns:
+        tuple: (data, solve function to pass it to)
+    """
+    if parsed and hasattr(module, 'read_parsed') and hasattr(module, 'solve_parsed'):
+        from lib.parsed_cache import load_parsed
+        return load_parsed(path, module.read_parsed, module.__file__), module.solve_parsed
+    return module.read_input(path), module.solve
+
+
+def benchmark(day, part, test=False, warmup=1, repeat=10, parsed=False):
+    """
+    Time reading the input and solving it separately.
+
+    With `parsed`, solutions with read_parsed()/solve_parsed() are timed on the
+    binary parsed-input cache, so after the first run the parse time is the
+    cost of hashing and mapping the cache file.
+
+    Args:
+        day: Day number (1-12)
+        part: Part number (1 or 2)
+        test: Whether to use test-input.txt instead of input.txt
+        warmup: Untimed runs before measuring
+        repeat: Timed runs
+        parsed: Use the parsed-input cache when the solution supports it
+
+    Returns:
+        dict: {'parse': stats, 'solve': stats, 'answer': last answer}
+    """
+    module = load_solution(day, part)
+    path = input_path(day, test)
+
+    parse_times = []
+    solve_times = []
+    answer = None
+
+    for run in range(warmup + repeat):
+        start = perf_counter()
+        data, solve = read_data(module, path, parsed)
+        read = perf_counter()
+        answer = solve(data)
+        solved = perf_counter()
+
+        if run >= warmup:
+            parse_times.append(read - start)
+            solve_times.append(solved - read)
+
+    return {
+        'parse': summarize(parse_times),
+        'solve': summarize(solve_times),
+        'answer': answer,
+    }
+
+
+def format_duration(seconds):
+    """
+    Format a duration with a unit that fits its size.
+
+    Args:
+        seconds: Duration in seconds
+
+    Returns:
+        str: e.g. '850ns', '12.3µs', '4.56ms', '1.23s'
+    """
+    if seconds < 1e-6:
+        return f"{seconds * 1e9:.0f}ns"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.2f}s"
+
+
+def format_stats(stats):
+    """
+    One-line rendering of summarize() output.
+
+    Args:
+        stats: Dict returned by summarize()
+
+    Returns:
+        str: Formatted line
+    """
+    return "  ".join(f"{name} {format_duration(stats[name]):>9}" for name in ('min', 'median', 'p95', 'stdev'))
@@ -0,0 +1,212 @@
+"""
+Fast, low-memory input readers for solutions.
+
+Files are memory-mapped rather than read into a str, so the OS pages them in
+and out as needed and inputs larger than RAM can still be scanned. Lines and
+records come back as bytes (or memoryview slices for zero-copy splitting), and
+integers are extracted straight into compact array('q') buffers.
+"""
+import mmap
+import re
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only ints_to_numpy() needs it
+    np = None
+
+READ_LINES_BLOCK = 1 << 16  # bytes decoded at a time by read_lines()
+UNSIGNED_INT = re.compile(rb'\d+')
+SIGNED_INT = re.compile(rb'-?\d+')
+
+
+def map_file(filename):
+    """
+    Memory-map a file read-only.
+
+    Args:
+        filename: File to map
+
+    Returns:
+        mmap.mmap or bytes: The mapping, or b'' for an empty file (which can't be mapped)
+    """
+    with open(filename, 'rb') as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return b''
+
+
+def split_view(buf, separator=b'\n'):
+    """
+    Split a buffer without copying it.
+
+    Args:
+        buf: bytes, bytearray or mmap to split
+        separator: Byte string between pieces
+
+    Yields:
+        memoryview: Each piece, as a slice of the original buffer
+    """
+    view = memoryview(buf)
+    start = 0
+    while True:
+        end = buf.find(separator, start)
+        if end == -1:
+            if start < len(buf):
+                yield view[start:]
+            return
+        yield view[start:end]
+        start = end + len(separator)
+
+
+def iter_records(filename, delimiter=b'\n', encoding=None):
+    """
+    Iterate over the delimiter-separated records of a file, memory-mapped.
+
+    Whitespace around each record is stripped and empty records are skipped,
+    so a trailing newline or a comma-separated list wrapped over lines both work.
+
+    Args:
+        filename: Input file
+        delimiter: Byte string between records (b',' for comma-separated input)
+        encoding: Decode records to str with this encoding; None keeps bytes
+
+    Yields:
+        bytes or str: Each record
+    """
+    buf = map_file(filename)
+    try:
+        if delimiter == b'\n' and isinstance(buf, mmap.mmap):
+            # mmap.readline() does the newline search in C
+            pieces = iter(buf.readline, b'')
+        else:
+            pieces = split_bytes(buf, delimiter)
+
+        for piece in pieces:
+            record = piece.strip()
+            if record:
+                yield record.decode(encoding) if encoding else record
+    finally:
+        if isinstance(buf, mmap.mmap):
+            buf.close()
+
+
+def split_bytes(buf, separator):
+    """Split a buffer lazily, copying out one piece at a time."""
+    start = 0
+    while True:
+        end = buf.find(separator, start)
+        if end == -1:
+            yield buf[start:]
+            return
+        yield buf[start:end]
+        start = end + len(separator)
+
+
+def iter_lines(filename, encoding=None):
+    """
+    Iterate over the non-empty lines of a file, memory-mapped.
+
+    Args:
+        filename: Input file
+        encoding: Decode lines to str with this encoding; None keeps bytes
+
+    Yields:
+        bytes or str: Each line without its line ending
+    """
+    return iter_records(filename, b'\n', encoding)
+
+
+def read_lines(filename, encoding='utf-8'):
+    """
+    Read every line of a file, memory-mapped.
+
+    Unlike iter_lines(), blank lines and whitespace inside lines are kept, so
+    blank-line-separated sections and column-aligned input survive. Only the
+    newlines at the very end of the file are dropped. The mapping is decoded
+    one block of whole lines at a time, so apart from the returned list only
+    about READ_LINES_BLOCK bytes of text are held at once.
+
+    Args:
+        filename: Input file
+        encoding: Encoding to decode the file with
+
+    Returns:
+        list: Lines as str, without line endings (empty for an empty file)
+    """
+    lines = []
+    buf = map_file(filename)
+    try:
+        start, size = 0, len(buf)
+        while start < size:
+            # cut each block just after a newline, so no line (or multi-byte character) is split
+            end = buf.find(b'\n', min(start + READ_LINES_BLOCK, size) - 1)
+            end = size if end == -1 else end + 1
+            # universal newlines, like a file opened in text mode
+            block = buf[start:end].decode(encoding).replace('\r\n', '\n')
+            pieces = block.split('\n')
+            if block.endswith('\n'):
+                pieces.pop()
+            lines.extend(pieces)
+            start = end
+    finally:
+        if isinstance(buf, mmap.mmap):
+            buf.close()
+
+    while lines and lines[-1] == '':
+        lines.pop()
+    return lines
+
+
+def extract_ints(buf, signed=False):
+    """
+    Pull every integer out of a buffer into a compact array.
+
+    Args:
+        buf: bytes, bytearray or mmap to scan
+        signed: Treat a '-' right before digits as a minus sign. Leave this off
+            for inputs like '11-22' where '-' is a separator.
+
+    Returns:
+        array.array: 'q' (int64) array of the integers, in order
+    """
+    pattern = SIGNED_INT if signed else UNSIGNED_INT
+    return array('q', (int(match.group()) for match in pattern.finditer(buf)))
+
+
+def read_ints(filename, signed=False):
+    """
+    Extract every integer in a file into an array('q').
+
+    Args:
+        filename: Input file
+        signed: See extract_ints()
+
+    Returns:
+        array.array: 'q' (int64) array of the integers, in order
+    """
+    buf = map_file(filename)
+    try:
+        return extract_ints(buf, signed)
+    finally:
+        if isinstance(buf, mmap.mmap):
+            buf.close()
+
+
+def ints_to_numpy(values):
+    """
+    View an array('q') as a numpy int64 array without copying.
+
+    Args:
+        values: array('q') from extract_ints() or read_ints()
+
+    Returns:
+        numpy.ndarray: int64 array sharing memory with values
+
+    Raises:
+        ImportError: If numpy isn't installed
+    """
+    if np is None:
+        raise ImportError("numpy is required for ints_to_numpy()")
+    return np.frombuffer(values, dtype=np.int64)
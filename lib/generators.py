@@ -0,0 +1,108 @@
+"""
+Seeded synthetic input generators for scaling tests.
+
+Each generator takes a size and a random.Random and writes an input file in the
+day's format. What the size means depends on the day:
+
+- Day 1: number of L/R rotations
+- Day 2: width of each ID range (ranges reach up to 10^18)
+- Day 3: number of digit banks
+
+Day 3 banks are DAY3_BANK_WIDTH digits wide like the real input; pass a width
+to generate_input() for long banks.
+"""
+import os
+import random
+
+DAY2_RANGES = 50
+DAY2_MAX_ID = 10 ** 18
+DAY3_BANK_WIDTH = 100
+WRITE_BATCH = 100_000
+
+
+def generate_rotations(f, size, rng, max_steps=999):
+    """
+    Write `size` Day 1 rotations like 'L68', one per line.
+
+    Args:
+        f: Text file to write to
+        size: Number of rotations
+        rng: random.Random instance
+        max_steps: Largest step count
+    """
+    for start in range(0, size, WRITE_BATCH):
+        count = min(WRITE_BATCH, size - start)
+        f.write(''.join(f"{rng.choice('LR')}{rng.randint(1, max_steps)}\n" for _ in range(count)))
+
+
+def generate_ranges(f, size, rng, ranges=DAY2_RANGES):
+    """
+    Write comma-separated Day 2 ID ranges, each `size` IDs wide.
+
+    Args:
+        f: Text file to write to
+        size: Width of every range
+        rng: random.Random instance
+        ranges: Number of ranges
+    """
+    pairs = []
+    for _ in range(ranges):
+        # pick the start's digit count uniformly so short and long IDs both show up
+        digits = rng.randint(1, 18)
+        low = max(rng.randint(10 ** (digits - 1), 10 ** digits - 1), 1)
+        low = min(low, DAY2_MAX_ID - size + 1)
+        pairs.append(f"{low}-{low + size - 1}")
+    f.write(','.join(pairs) + '\n')
+
+
+def generate_banks(f, size, rng, width=DAY3_BANK_WIDTH):
+    """
+    Write `size` Day 3 battery banks of `width` digits each.
+
+    Args:
+        f: Text file to write to
+        size: Number of banks
+        rng: random.Random instance
+        width: Digits per bank
+    """
+    for start in range(0, size, WRITE_BATCH // width + 1):
+        count = min(WRITE_BATCH // width + 1, size - start)
+        f.write(''.join(''.join(rng.choices('123456789', k=width)) + '\n' for _ in range(count)))
+
+
+GENERATORS = {
+    1: (generate_rotations, 'rotations'),
+    2: (generate_ranges, 'range width'),
+    3: (generate_banks, 'banks'),
+}
+WIDTH_DAYS = {3}  # generators that take a width (digits per bank)
+
+
+def generate_input(day, size, path, seed=0, width=None):
+    """
+    Write a synthetic input file for a day.
+
+    Args:
+        day: Day number with a generator
+        size: Scale of the input (see the module docstring)
+        path: File to write
+        seed: Random seed, so the same arguments always give the same file
+        width: Digits per bank for the days in WIDTH_DAYS (defaults to the
+            generator's own width)
+
+    Raises:
+        ValueError: If there is no generator for the day, or it takes no width
+    """
+    if day not in GENERATORS:
+        raise ValueError(f"No input generator for day {day} (available: {sorted(GENERATORS)})")
+    if width is not None and day not in WIDTH_DAYS:
+        raise ValueError(f"The day {day} generator has no width (only days {sorted(WIDTH_DAYS)})")
+    if width is not None and width < 1:
+        raise ValueError(f"Width must be at least 1, got {width}")
+
+    generator, _ = GENERATORS[day]
+    options = {} if width is None else {'width': width}
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        generator(f, size, random.Random(seed), **options)
+    os.replace(tmp_path, path)
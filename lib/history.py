@@ -0,0 +1,145 @@
+"""
+Persistent benchmark history and regression checks.
+
+Every benchmarked run is appended as one JSON line to .aoc/bench-history.jsonl.
+A run is compared against the median of the runs before it for the same day,
+part, input and parse mode (text or the binary parsed cache).
+"""
+import json
+import platform
+import statistics
+import subprocess
+from datetime import datetime
+
+from lib.utils import state_path, file_sha256
+
+HISTORY_FILE = 'bench-history.jsonl'
+
+
+def git_commit():
+    """
+    Current git commit of the project.
+
+    Returns:
+        str: Commit hash (with a '-dirty' suffix for uncommitted changes), or None outside git
+    """
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True)
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit.stdout.strip() + ('-dirty' if status.stdout.strip() else '')
+
+
+def make_record(day, part, input_file, result, warmup, repeat, parsed_cache=False):
+    """
+    Build a history record for one benchmark.
+
+    Args:
+        day: Day number (1-12)
+        part: Part number (1 or 2)
+        input_file: Input file the benchmark read
+        result: Dict returned by lib.bench.benchmark()
+        warmup: Untimed runs used
+        repeat: Timed runs used
+        parsed_cache: Whether the run used the binary parsed-input cache
+
+    Returns:
+        dict: JSON-serializable record
+    """
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'day': day,
+        'part': part,
+        'input': input_file,
+        'input_sha256': file_sha256(input_file),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'warmup': warmup,
+        'repeat': repeat,
+        'parsed_cache': parsed_cache,
+        'parse': result['parse'],
+        'solve': result['solve'],
+    }
+
+
+def append_record(record, path=None):
+    """
+    Append a record to the history file.
+
+    Args:
+        record: Record from make_record()
+        path: History file (defaults to .aoc/bench-history.jsonl)
+    """
+    path = path or state_path(HISTORY_FILE)
+    with open(path, 'a') as f:
+        f.write(json.dumps(record) + '\n')
+
+
+def load_records(path=None):
+    """
+    Read every record from the history file.
+
+    Args:
+        path: History file (defaults to .aoc/bench-history.jsonl)
+
+    Returns:
+        list: Records in the order they were written
+    """
+    path = path or state_path(HISTORY_FILE)
+    records = []
+    try:
+        with open(path, 'r') as f:
+            for line in f:
+                if line.strip():
+                    records.append(json.loads(line))
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def compare_latest(records, window=5, threshold=1.2, metric='median'):
+    """
+    Compare the latest run of each day/part/input/parse mode against its rolling baseline.
+
+    The baseline for a step (parse or solve) is the median of that step's
+    `metric` over the `window` runs before the latest one.
+
+    Args:
+        records: Records from load_records()
+        window: Number of earlier runs in the baseline
+        threshold: Slowdown ratio that counts as a regression (1.2 = 20% slower)
+        metric: Statistic to compare ('min', 'median', 'p95')
+
+    Returns:
+        list: One dict per day/part/input/parse mode with the latest and baseline timings,
+            ratios, and whether it regressed. Keys with no earlier runs are skipped.
+    """
+    grouped = {}
+    for record in records:
+        # records from before the parsed cache existed are text-parse runs
+        key = (record['day'], record['part'], record['input_sha256'], record.get('parsed_cache', False))
+        grouped.setdefault(key, []).append(record)
+
+    comparisons = []
+    for (day, part, _, parsed_cache), runs in sorted(grouped.items(), key=lambda item: item[0][:2]):
+        if len(runs) < 2:
+            continue
+
+        latest = runs[-1]
+        earlier = runs[-1 - window:-1]
+        comparison = {'day': day, 'part': part, 'input': latest['input'], 'parsed_cache': parsed_cache,
+                      'runs': len(earlier), 'regressed': False}
+
+        for step in ('parse', 'solve'):
+            baseline = statistics.median(run[step][metric] for run in earlier)
+            current = latest[step][metric]
+            ratio = current / baseline if baseline > 0 else 1.0
+            comparison[step] = {'latest': current, 'baseline': baseline, 'ratio': ratio}
+            if ratio > threshold:
+                comparison['regressed'] = True
+
+        comparisons.append(comparison)
+
+    return comparisons
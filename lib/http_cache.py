@@ -0,0 +1,137 @@
+"""
+On-disk cache of HTTP responses for the AoC client.
+
+Entries are keyed on the URL and a hash of the session cookie, so switching
+accounts never serves another account's input. Each entry is a body file plus
+a small JSON file with the ETag and Last-Modified validators used for
+conditional requests. The cookie itself is never written to disk.
+"""
+import hashlib
+import json
+import os
+from time import time
+
+from lib.utils import state_path
+
+
+def session_identity(session_cookie):
+    """Short, non-reversible identifier for a session cookie."""
+    return hashlib.sha256(session_cookie.encode()).hexdigest()[:16]
+
+
+def write_atomic(path, text):
+    """Write a text file through a temporary file, so readers never see half of it."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+class HttpCache:
+    """Response bodies and their validators under .aoc/http-cache/."""
+
+    def __init__(self, identity, directory='http-cache'):
+        """
+        Args:
+            identity: session_identity() of the account the responses belong to
+            directory: Folder under .aoc/
+        """
+        self.identity = identity
+        self.directory = directory
+
+    def _paths(self, url):
+        key = hashlib.sha256(f"{self.identity}\0{url}".encode()).hexdigest()
+        return state_path(self.directory, f"{key}.body"), state_path(self.directory, f"{key}.json")
+
+    def get(self, url):
+        """
+        Cached response for a URL.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            dict: 'body' (str), 'etag', 'last_modified' and 'fetched_at', or
+                None if the URL isn't cached
+        """
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path) as f:
+                entry = json.load(f)
+            with open(body_path, encoding='utf-8', newline='') as f:
+                entry['body'] = f.read()
+        except (FileNotFoundError, ValueError):
+            return None
+        return entry
+
+    def cached_file(self, url):
+        """
+        File holding the cached body of a URL.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            str: Path of the body file, or None if the URL isn't cached
+        """
+        body_path, meta_path = self._paths(url)
+        return body_path if os.path.exists(meta_path) else None
+
+    def put(self, url, body, headers=None):
+        """
+        Store a response body and its validators.
+
+        Args:
+            url: Request URL
+            body: Response text
+            headers: Response headers (anything with .get())
+        """
+        body_path, meta_path = self._paths(url)
+        # body first, so a metadata file always points at a complete body
+        write_atomic(body_path, body)
+        self._write_meta(url, meta_path, headers)
+
+    def staging_path(self, url):
+        """Where to stream a body for put_file(), inside the cache folder."""
+        body_path, _ = self._paths(url)
+        return f"{body_path}.download"
+
+    def put_file(self, url, path, headers=None):
+        """
+        Store a response body that was streamed to a file, moving the file into the cache.
+
+        Args:
+            url: Request URL
+            path: Downloaded body, from staging_path()
+            headers: Response headers (anything with .get())
+        """
+        body_path, meta_path = self._paths(url)
+        os.replace(path, body_path)
+        self._write_meta(url, meta_path, headers)
+
+    def _write_meta(self, url, meta_path, headers):
+        headers = headers or {}
+        entry = {
+            'url': url,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'fetched_at': time(),
+        }
+        write_atomic(meta_path, json.dumps(entry))
+
+    def validators(self, entry):
+        """
+        Conditional request headers for a cached entry.
+
+        Args:
+            entry: Result of get(), or None
+
+        Returns:
+            dict: If-None-Match / If-Modified-Since headers (empty without validators)
+        """
+        headers = {}
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
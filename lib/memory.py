@@ -0,0 +1,151 @@
+"""
+Memory instrumentation for solution runs.
+
+Peak RSS comes from resource.getrusage (not available on Windows). On Linux the
+peak can also be reset, so a reused worker process can measure each job on its
+own (see reset_peak_rss()). The tracemalloc report shows which lines of read_input() and solve() allocate the
+most.
+"""
+import sys
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from lib.runner import load_solution, input_path
+
+
+def peak_rss(children=False):
+    """
+    Peak resident set size of this process or of its finished children.
+
+    Args:
+        children: Report the largest waited-for child instead of this process
+
+    Returns:
+        int: Peak RSS in bytes, or None where getrusage isn't available
+    """
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    # Linux reports kilobytes, macOS reports bytes
+    return usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+
+
+def reset_peak_rss():
+    """
+    Start a new peak RSS measurement for this process, where the OS allows it.
+
+    getrusage() only ever reports the peak since the process started. Linux can
+    reset that high-water mark through /proc/self/clear_refs, after which
+    VmHWM in /proc/self/status holds the peak since the reset.
+
+    Returns:
+        bool: Whether the peak was reset (read it with peak_rss_since_reset())
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        return False
+    return True
+
+
+def peak_rss_since_reset():
+    """
+    Peak resident set size of this process since the last reset_peak_rss().
+
+    Returns:
+        int: Peak RSS in bytes, or None where /proc/self/status isn't available
+    """
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def format_bytes(size):
+    """
+    Format a byte count with a binary unit.
+
+    Args:
+        size: Number of bytes, or None
+
+    Returns:
+        str: e.g. '512 B', '12.3 KiB', '45.6 MiB', or 'n/a'
+    """
+    if size is None:
+        return "n/a"
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if size < 1024 or unit == 'GiB':
+            return f"{size} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def top_allocations(snapshot, start, top):
+    """
+    Lines holding the most new memory at the end of a phase.
+
+    Memory freed again before the snapshot doesn't show up here; the traced
+    peak in trace_solution() covers that.
+
+    Args:
+        snapshot: Snapshot taken after the phase
+        start: Snapshot taken before the phase
+        top: Number of lines to return
+
+    Returns:
+        list: tracemalloc.StatisticDiff entries, largest first
+    """
+    ignore = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    ]
+    diff = snapshot.filter_traces(ignore).compare_to(start.filter_traces(ignore), 'lineno')
+    return [stat for stat in diff if stat.size_diff > 0][:top]
+
+
+def trace_solution(day, part, test=False, top=10):
+    """
+    Run read_input() and solve() under tracemalloc.
+
+    Args:
+        day: Day number (1-12)
+        part: Part number (1 or 2)
+        test: Whether to use test-input.txt instead of input.txt
+        top: Allocation sites to keep per phase
+
+    Returns:
+        dict: answer, plus for 'parse' and 'solve' the traced peak in bytes and
+            their top allocation sites
+    """
+    module = load_solution(day, part)
+    path = input_path(day, test)
+
+    tracemalloc.start()
+    try:
+        before_parse = tracemalloc.take_snapshot()
+        data = module.read_input(path)
+        after_parse = tracemalloc.take_snapshot()
+        _, parse_peak = tracemalloc.get_traced_memory()
+
+        tracemalloc.reset_peak()
+        answer = module.solve(data)
+        after_solve = tracemalloc.take_snapshot()
+        _, solve_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'answer': answer,
+        'parse': {'peak': parse_peak, 'sites': top_allocations(after_parse, before_parse, top)},
+        'solve': {'peak': solve_peak, 'sites': top_allocations(after_solve, after_parse, top)},
+    }
@@ -0,0 +1,64 @@
+"""
+Binary cache of parsed inputs.
+
+Solutions that define read_parsed(filename) -> array('q') and
+solve_parsed(values) can skip text parsing on repeat runs: the parsed array is
+stored as raw int64s in .aoc/parsed/ and memory-mapped on later runs. The key
+covers the input, the solution file and the local modules it imports (see
+lib.answer_cache.answer_key), so editing the input or the parser never serves a
+stale array.
+"""
+import mmap
+import os
+from array import array
+
+from lib.answer_cache import answer_key
+from lib.utils import state_path
+
+
+def parsed_cache_path(input_file, script_path):
+    """
+    Cache file for an input parsed by a given solution.
+
+    Args:
+        input_file: Input text file
+        script_path: Solution file defining the parser
+
+    Returns:
+        str: Path under .aoc/parsed/
+    """
+    return state_path('parsed', f"{answer_key(script_path, input_file)}.q")
+
+
+def load_parsed(input_file, parse, script_path):
+    """
+    Parsed form of an input, from the cache when possible.
+
+    Args:
+        input_file: Input text file
+        parse: Function turning the input file into an array('q')
+        script_path: Solution file defining `parse`, so a changed parser gets a new entry
+
+    Returns:
+        memoryview or array.array: int64 values; a read-only memoryview over
+            the mapped cache file, or the freshly parsed array on a miss
+    """
+    path = parsed_cache_path(input_file, script_path)
+
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            try:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty files can't be mapped
+                return array('q')
+        return memoryview(mapping).cast('q')
+
+    values = parse(input_file)
+    if not isinstance(values, array) or values.typecode != 'q':
+        values = array('q', values)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        values.tofile(f)
+    os.replace(tmp_path, path)
+    return values
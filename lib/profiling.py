@@ -0,0 +1,129 @@
+"""
+Profilers for solution runs.
+
+Two modes: cProfile for exact per-function timings, and a lightweight
+sampling profiler that writes collapsed stacks ('a;b;c count' lines), the
+input format of flamegraph.pl, speedscope and inferno.
+"""
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+
+from lib.runner import load_solution, input_path
+
+
+def profile_solution(day, part, test=False, top=25, sort='cumulative'):
+    """
+    Run read_input() and solve() under cProfile.
+
+    Args:
+        day: Day number (1-12)
+        part: Part number (1 or 2)
+        test: Whether to use test-input.txt instead of input.txt
+        top: Number of functions to list
+        sort: pstats sort key ('cumulative', 'tottime', 'calls', ...)
+
+    Returns:
+        tuple: (answer, report text)
+    """
+    module = load_solution(day, part)
+    path = input_path(day, test)
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        answer = module.solve(module.read_input(path))
+    finally:
+        profiler.disable()
+
+    report = io.StringIO()
+    stats = pstats.Stats(profiler, stream=report)
+    stats.strip_dirs().sort_stats(sort).print_stats(top)
+    return answer, report.getvalue()
+
+
+def frame_label(frame):
+    """Flamegraph label for a frame: function name plus file and line."""
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def sample_solution(day, part, test=False, interval=0.001):
+    """
+    Run read_input() and solve() while sampling the call stack from another thread.
+
+    Args:
+        day: Day number (1-12)
+        part: Part number (1 or 2)
+        test: Whether to use test-input.txt instead of input.txt
+        interval: Seconds between samples
+
+    Returns:
+        tuple: (answer, Counter of collapsed stack strings to sample counts)
+    """
+    module = load_solution(day, part)
+    path = input_path(day, test)
+
+    target = threading.get_ident()
+    root = sys._getframe()  # stacks are cut here so the harness frames don't show up
+    stacks = Counter()
+    done = threading.Event()
+
+    def sampler():
+        while not done.wait(interval):
+            frame = sys._current_frames().get(target)
+            labels = []
+            while frame is not None and frame is not root:
+                labels.append(frame_label(frame))
+                frame = frame.f_back
+            if labels:
+                stacks[';'.join(reversed(labels))] += 1
+
+    # the sampler only runs when it gets the GIL, so hand it over about as often as we want samples
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(min(interval, switch_interval))
+
+    thread = threading.Thread(target=sampler, daemon=True)
+    thread.start()
+    try:
+        answer = module.solve(module.read_input(path))
+    finally:
+        done.set()
+        thread.join()
+        sys.setswitchinterval(switch_interval)
+
+    return answer, stacks
+
+
+def write_collapsed(stacks, path):
+    """
+    Write sampled stacks in collapsed format.
+
+    Args:
+        stacks: Counter from sample_solution()
+        path: Output file
+    """
+    with open(path, 'w') as f:
+        for stack, count in sorted(stacks.items()):
+            f.write(f"{stack} {count}\n")
+
+
+def hottest_functions(stacks, top=10):
+    """
+    Functions that were on top of the stack most often.
+
+    Args:
+        stacks: Counter from sample_solution()
+        top: Number of functions to return
+
+    Returns:
+        list: (label, samples) pairs, most sampled first
+    """
+    leaves = Counter()
+    for stack, count in stacks.items():
+        leaves[stack.rsplit(';', 1)[-1]] += count
+    return leaves.most_common(top)
@@ -0,0 +1,307 @@
+"""
+Runner for solution files.
+
+Solutions are imported and called in-process by default, which skips the
+interpreter startup a subprocess pays on every run. The old subprocess mode is
+kept for runs that need isolation.
+"""
+import importlib.util
+import os
+import subprocess
+import sys
+import traceback
+from contextlib import contextmanager
+from time import perf_counter
+
+STDIN = '-'
+STREAM_THRESHOLD = 256 * 1024 * 1024  # inputs larger than this go through solve_stream()
+# when set, load_solution() writes its value to stderr first (see aoc.py --startup-profile)
+STARTUP_MARKER_ENV = 'AOC_STARTUP_MARKER'
+
+_local_modules = {}  # solution module name -> helper modules it imported from its day folder
+
+
+def solution_path(day, part):
+    """
+    Path of a day's solution script.
+
+    Args:
+        day: Day number (1-12)
+        part: Part number (1 or 2)
+
+    Returns:
+        str: Path to dayN/stepM.py
+    """
+    return os.path.join(f"day{day}", f"step{part}.py")
+
+
+def input_path(day, test=False):
+    """
+    Path of a day's input file.
+
+    Args:
+        day: Day number (1-12)
+        test: Whether to use test-input.txt instead of input.txt
+
+    Returns:
+        str: Path to the input file
+    """
+    return os.path.join(f"day{day}", 'test-input.txt' if test else 'input.txt')
+
+
+def load_solution(day, part, reload=False):
+    """
+    Import dayN/stepM.py as a module.
+
+    The day directory is on sys.path while the module executes, so solutions can
+    import helper modules that sit next to them, just like when run as scripts.
+    Those helpers are dropped from sys.modules again afterwards: they are
+    imported under bare names ('batteries', 'dial'), and another day's helper
+    with the same name must not get this day's module. solution_imports() puts
+    them back while the solution runs.
+
+    Args:
+        day: Day number (1-12)
+        part: Part number (1 or 2)
+        reload: Re-execute the file even if it was already imported
+
+    Returns:
+        module: The solution module
+    """
+    module_name = f"day{day}_step{part}"
+    if not reload and module_name in sys.modules:
+        return sys.modules[module_name]
+
+    day_dir = os.path.abspath(f"day{day}")
+    spec = importlib.util.spec_from_file_location(module_name, solution_path(day, part))
+    module = importlib.util.module_from_spec(spec)
+
+    marker = os.environ.get(STARTUP_MARKER_ENV)
+    if marker:
+        print(marker, file=sys.stderr, flush=True)
+
+    sys.path.insert(0, day_dir)
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(day_dir)
+        helpers = forget_local_modules(day_dir)
+
+    _local_modules[module_name] = helpers
+    sys.modules[module_name] = module
+    return module
+
+
+@contextmanager
+def solution_imports(day, part):
+    """
+    Make a loaded solution's day folder importable while it runs.
+
+    The folder goes back on sys.path and the helpers the solution imported go
+    back into sys.modules under their bare names, so imports inside solve() work
+    and process pools can pickle helper functions by module name. Both are
+    undone on exit.
+
+    Args:
+        day: Day number (1-12)
+        part: Part number (1 or 2), already loaded with load_solution()
+    """
+    day_dir = os.path.abspath(f"day{day}")
+    helpers = _local_modules.get(f"day{day}_step{part}", {})
+    shadowed = {name: sys.modules[name] for name in helpers if name in sys.modules}
+
+    sys.modules.update(helpers)
+    sys.path.insert(0, day_dir)
+    try:
+        yield
+    finally:
+        sys.path.remove(day_dir)
+        forget_local_modules(day_dir)
+        sys.modules.update(shadowed)
+
+
+def forget_local_modules(directory):
+    """
+    Remove modules loaded from a directory from sys.modules.
+
+    Modules that already imported them keep their references; the next import
+    of the same name loads a fresh copy from wherever sys.path points then.
+
+    Args:
+        directory: Absolute path of the folder
+
+    Returns:
+        dict: The removed modules by name
+    """
+    prefix = directory + os.sep
+    removed = {}
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, '__file__', None)
+        if path and os.path.abspath(path).startswith(prefix):
+            removed[name] = sys.modules.pop(name)
+    return removed
+
+
+def stream_records(path):
+    """
+    Lazily read input lines for solve_stream().
+
+    Args:
+        path: Input file, or '-' for stdin
+
+    Returns:
+        iterator: Non-empty lines as str, without line endings
+    """
+    if path == STDIN:
+        return (line.strip() for line in sys.stdin if line.strip())
+
+    from lib.fast_input import iter_lines
+    return iter_lines(path, encoding='utf-8')
+
+
+def should_stream(module, path):
+    """
+    Whether to run a solution through its large-input path (see run_solution()).
+
+    Args:
+        module: Solution module
+        path: Input file, or '-' for stdin
+
+    Returns:
+        bool: True for stdin when the solution has a solve_stream(), or for
+            inputs over STREAM_THRESHOLD bytes when it has a solve_stream() or a
+            solve_file()
+    """
+    if path == STDIN:
+        return hasattr(module, 'solve_stream')
+    if not (hasattr(module, 'solve_stream') or hasattr(module, 'solve_file')):
+        return False
+    return os.path.getsize(path) > STREAM_THRESHOLD
+
+
+def run_solution(day, part, test=False, input_file=None, stream=None):
+    """
+    Run a solution in this process.
+
+    The large-input path is solve_file(path) when the solution defines it and
+    the input is a file, else solve_stream() over the input's lines.
+
+    Args:
+        day: Day number (1-12)
+        part: Part number (1 or 2)
+        test: Whether to use test-input.txt instead of input.txt
+        input_file: Input file to use instead, or '-' for stdin
+        stream: Force (True) or disable (False) the large-input path; None
+            picks it automatically for stdin and large inputs
+
+    Returns:
+        The object returned by the solution's solve(), solve_file() or solve_stream()
+
+    Raises:
+        ValueError: If the input is stdin and the solution has no solve_stream()
+    """
+    module = load_solution(day, part)
+    path = input_file or input_path(day, test)
+
+    if stream is None:
+        stream = should_stream(module, path)
+
+    with solution_imports(day, part):
+        if stream and path != STDIN and hasattr(module, 'solve_file'):
+            return module.solve_file(path)
+        if stream:
+            if not hasattr(module, 'solve_stream'):
+                raise ValueError(f"Day {day} Part {part} has no solve_stream() for streamed input")
+            return module.solve_stream(stream_records(path))
+
+        if path == STDIN:
+            raise ValueError(f"Day {day} Part {part} has no solve_stream() to read stdin with")
+        return module.solve(module.read_input(path))
+
+
+def timed_run(day, part, test=False):
+    """
+    Run a solution in this process and time it, catching any failure.
+
+    Args:
+        day: Day number (1-12)
+        part: Part number (1 or 2)
+        test: Whether to use test-input.txt instead of input.txt
+
+    Returns:
+        dict: day, part, answer (as text), error (traceback text or None),
+            wall time in seconds, peak RSS in bytes, and whether that peak is
+            this job's alone ('rss_per_job'; otherwise it is the process's peak
+            so far, which covers earlier jobs run by the same worker)
+    """
+    from lib.memory import peak_rss, peak_rss_since_reset, reset_peak_rss
+
+    per_job = reset_peak_rss()
+    start = perf_counter()
+    try:
+        answer, error = str(run_solution(day, part, test)), None
+    except Exception:
+        answer, error = None, traceback.format_exc()
+    return {'day': day, 'part': part, 'answer': answer, 'error': error, 'elapsed': perf_counter() - start,
+            'peak_rss': peak_rss_since_reset() if per_job else peak_rss(), 'rss_per_job': per_job}
+
+
+def run_many(jobs, test=False, workers=None):
+    """
+    Run several solutions concurrently across a process pool.
+
+    Workers are reused across jobs, so the pool only pays for interpreter
+    startup once per worker. Each job resets its worker's peak RSS where the OS
+    allows it (see timed_run()).
+
+    Args:
+        jobs: List of (day, part) pairs
+        test: Whether to use test-input.txt instead of input.txt
+        workers: Pool size (defaults to the CPU count)
+
+    Yields:
+        dict: timed_run() results, in the order the jobs finish
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = [executor.submit(timed_run, day, part, test) for day, part in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_solution_subprocess(day, part, test=False, capture=False):
+    """
+    Run a solution script in a fresh interpreter.
+
+    Args:
+        day: Day number (1-12)
+        part: Part number (1 or 2)
+        test: Whether to pass --test to the script
+        capture: Capture stdout/stderr as text instead of streaming them
+
+    Returns:
+        subprocess.CompletedProcess: The finished process
+    """
+    command = [sys.executable, f"step{part}.py"]
+    if test:
+        command.append("--test")
+    return subprocess.run(command, cwd=f"day{day}", capture_output=capture, text=capture)
+
+
+def extract_answer(output, label='Result:'):
+    """
+    Find the answer in a solution script's output.
+
+    Args:
+        output: Captured stdout of the script
+        label: Text the script prints before the answer
+
+    Returns:
+        str: Text after the last label, or None if there is none
+    """
+    answer = None
+    for line in output.split('\n'):
+        if label in line:
+            answer = line.split(label)[-1].strip()
+    return answer
@@ -0,0 +1,106 @@
+"""
+Scaling benchmarks on generated inputs.
+
+A solution is timed on inputs of increasing size and the empirical complexity
+exponent k in time ~ size^k is fitted on a log-log scale.
+"""
+import math
+import os
+from time import perf_counter
+
+from lib.generators import generate_input
+from lib.runner import load_solution
+from lib.utils import state_path
+
+DEFAULT_SIZES = {
+    1: [10 ** 4, 10 ** 5, 10 ** 6, 3 * 10 ** 6],
+    2: [10 ** 3, 10 ** 6, 10 ** 9, 10 ** 12, 10 ** 15],
+    3: [10 ** 3, 10 ** 4, 10 ** 5, 3 * 10 ** 5],
+}
+
+
+def generated_input_path(day, size, seed, width=None):
+    """Where the generated input for a day, size, seed and (optional) width is kept."""
+    suffix = '' if width is None else f"-w{width}"
+    return state_path('generated', f"day{day}-{size}{suffix}-seed{seed}.txt")
+
+
+def time_run(module, path, repeat):
+    """
+    Best-of-`repeat` timing of read_input() plus solve().
+
+    Args:
+        module: Solution module
+        path: Input file
+        repeat: Number of timed runs
+
+    Returns:
+        tuple: (seconds, answer)
+    """
+    best = math.inf
+    answer = None
+    for _ in range(repeat):
+        start = perf_counter()
+        answer = module.solve(module.read_input(path))
+        best = min(best, perf_counter() - start)
+    return best, answer
+
+
+def fit_exponent(points):
+    """
+    Least-squares slope of log(time) against log(size).
+
+    Args:
+        points: List of (size, seconds) pairs
+
+    Returns:
+        float: Fitted exponent, or None with fewer than two usable points
+    """
+    logs = [(math.log(size), math.log(seconds)) for size, seconds in points if size > 0 and seconds > 0]
+    if len(logs) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in logs) / len(logs)
+    mean_y = sum(y for _, y in logs) / len(logs)
+    spread = sum((x - mean_x) ** 2 for x, _ in logs)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in logs) / spread
+
+
+def run_scaling(day, part, sizes=None, seed=0, repeat=3, max_seconds=10.0, on_result=None, width=None):
+    """
+    Time a solution on generated inputs of increasing size.
+
+    Stops early once a size takes longer than `max_seconds`, so a solution with
+    bad complexity doesn't run for hours on the larger sizes.
+
+    Args:
+        day: Day number with a generator
+        part: Part number (1 or 2)
+        sizes: Input sizes to try (defaults to DEFAULT_SIZES for the day)
+        seed: Random seed for the generated inputs
+        repeat: Timed runs per size (best one counts)
+        max_seconds: Time after which larger sizes are skipped
+        on_result: Called with each (size, seconds, answer) as it is measured
+        width: Digits per bank for generators that take one (see lib.generators)
+
+    Returns:
+        dict: 'points' as (size, seconds) pairs and the fitted 'exponent'
+    """
+    module = load_solution(day, part)
+    points = []
+
+    for size in sorted(sizes or DEFAULT_SIZES[day]):
+        path = generated_input_path(day, size, seed, width)
+        if not os.path.exists(path):
+            generate_input(day, size, path, seed, width=width)
+
+        seconds, answer = time_run(module, path, repeat)
+        points.append((size, seconds))
+        if on_result:
+            on_result(size, seconds, answer)
+        if seconds > max_seconds:
+            break
+
+    return {'points': points, 'exponent': fit_exponent(points)}
@@ -0,0 +1,222 @@
+"""
+Submission bookkeeping shared by every aoc.py process.
+
+A token bucket in .aoc/submit-rate.json spaces out submissions across
+processes and remembers server-side lockouts. A ledger in
+.aoc/submissions.json records every answer sent with its verdict, so repeated,
+known-wrong or out-of-bounds answers are rejected before they cost a lockout.
+Both files are read and written under an exclusive file lock (fcntl, so on
+Windows the lock is skipped).
+"""
+import json
+import os
+import re
+from contextlib import contextmanager
+from datetime import datetime
+from time import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from lib.utils import state_path
+
+LEDGER_FILE = 'submissions.json'
+RATE_FILE = 'submit-rate.json'
+LOCK_FILE = 'submissions.lock'
+
+CORRECT = 'correct'
+TOO_HIGH = 'too_high'
+TOO_LOW = 'too_low'
+WRONG = 'wrong'
+RATE_LIMITED = 'rate_limited'
+WRONG_LEVEL = 'wrong_level'
+UNKNOWN = 'unknown'
+
+REJECTED = (TOO_HIGH, TOO_LOW, WRONG)
+
+WAIT_PATTERN = re.compile(r'You have (?:(\d+)m\s*)?(?:(\d+)s\s*)?left to wait')
+WAIT_WORDS = {'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'ten': 10}
+WAIT_MINUTES_PATTERN = re.compile(r'[Pp]lease wait (\w+) minutes?')
+
+
+@contextmanager
+def locked():
+    """Hold the exclusive lock on the submission state files."""
+    with open(state_path(LOCK_FILE), 'a') as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def read_json(path, default):
+    """Load a JSON state file, or `default` if it is missing or unreadable."""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return default
+
+
+def write_json(path, data):
+    """Replace a JSON state file atomically."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=1)
+    os.replace(tmp_path, path)
+
+
+def lockout_seconds(text):
+    """
+    Server-side wait announced in a submission response.
+
+    Args:
+        text: Response text or HTML
+
+    Returns:
+        int: Seconds to wait, or 0 if the response doesn't mention one
+    """
+    match = WAIT_PATTERN.search(text)
+    if match and any(match.groups()):
+        minutes, seconds = match.groups()
+        return int(minutes or 0) * 60 + int(seconds or 0)
+
+    match = WAIT_MINUTES_PATTERN.search(text)
+    if match:
+        word = match.group(1).lower()
+        minutes = int(word) if word.isdigit() else WAIT_WORDS.get(word, 1)
+        return minutes * 60
+    return 0
+
+
+class SubmissionLimiter:
+    """Token bucket for submissions, persisted so every process shares it."""
+
+    def __init__(self, interval, capacity=1, path=None):
+        """
+        Args:
+            interval: Seconds to refill one token
+            capacity: Submissions allowed back to back after a quiet period
+            path: State file (defaults to .aoc/submit-rate.json)
+        """
+        self.rate = 1 / interval
+        self.capacity = capacity
+        self.path = path or state_path(RATE_FILE)
+
+    def reserve(self):
+        """
+        Take a token, reserving a future one if the bucket is empty.
+
+        Returns:
+            float: Seconds the caller must wait before submitting
+        """
+        with locked():
+            now = time()
+            state = read_json(self.path, {'tokens': self.capacity, 'updated': now, 'blocked_until': 0})
+            tokens = min(self.capacity, state['tokens'] + (now - state['updated']) * self.rate)
+            # going negative queues this caller behind earlier reservations
+            tokens -= 1
+            wait = max(0.0, -tokens / self.rate, state['blocked_until'] - now)
+            write_json(self.path, {'tokens': tokens, 'updated': now, 'blocked_until': state['blocked_until']})
+        return wait
+
+    def block_for(self, seconds):
+        """
+        Record a server-side lockout that every process has to wait out.
+
+        Args:
+            seconds: Length of the lockout from now
+        """
+        with locked():
+            now = time()
+            state = read_json(self.path, {'tokens': self.capacity, 'updated': now, 'blocked_until': 0})
+            state['blocked_until'] = max(state['blocked_until'], now + seconds)
+            write_json(self.path, state)
+
+
+class SubmissionLedger:
+    """Answers submitted per day and part, with their verdicts."""
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path: Ledger file (defaults to .aoc/submissions.json)
+        """
+        self.path = path or state_path(LEDGER_FILE)
+
+    def entries(self, day, part):
+        """
+        Submissions for a day and part, oldest first.
+
+        Returns:
+            list: Dicts with answer, verdict and time
+        """
+        with locked():
+            return read_json(self.path, {}).get(f"{day}-{part}", [])
+
+    def check(self, day, part, answer):
+        """
+        Reason not to submit an answer, based on earlier verdicts.
+
+        Args:
+            day: Day number (1-12)
+            part: Part number (1 or 2)
+            answer: Answer about to be submitted
+
+        Returns:
+            str: Why the answer would be wasted, or None if it is worth sending
+        """
+        answer = str(answer)
+        entries = self.entries(day, part)
+
+        for entry in entries:
+            if entry['verdict'] == CORRECT:
+                if entry['answer'] == answer:
+                    return f"{answer} was already accepted"
+                return f"Day {day} Part {part} is already solved (with {entry['answer']})"
+            if entry['answer'] == answer and entry['verdict'] in REJECTED:
+                return f"{answer} was already rejected ({entry['verdict'].replace('_', ' ')})"
+
+        try:
+            value = int(answer)
+        except ValueError:
+            return None
+
+        too_high = [int(e['answer']) for e in entries if e['verdict'] == TOO_HIGH and is_int(e['answer'])]
+        too_low = [int(e['answer']) for e in entries if e['verdict'] == TOO_LOW and is_int(e['answer'])]
+        if too_high and value >= min(too_high):
+            return f"{answer} is not below {min(too_high)}, which was too high"
+        if too_low and value <= max(too_low):
+            return f"{answer} is not above {max(too_low)}, which was too low"
+        return None
+
+    def record(self, day, part, answer, verdict):
+        """
+        Add a submission and its verdict to the ledger.
+
+        Args:
+            day: Day number (1-12)
+            part: Part number (1 or 2)
+            answer: Submitted answer
+            verdict: One of the verdict constants in this module
+        """
+        with locked():
+            ledger = read_json(self.path, {})
+            ledger.setdefault(f"{day}-{part}", []).append(
+                {'answer': str(answer), 'verdict': verdict, 'time': datetime.now().isoformat()}
+            )
+            write_json(self.path, ledger)
+
+
+def is_int(text):
+    """Whether a string is an integer literal."""
+    try:
+        int(text)
+    except ValueError:
+        return False
+    return True
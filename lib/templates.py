@@ -8,11 +8,19 @@ Advent of Code 2025 - Day {day} Part {part}
 See step{part}.md for problem description.
 """
 
+import os
+import sys
+
+# make lib/ importable when run as a script from this folder
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from lib.fast_input import read_lines
+
 def read_input(filename):
     """Read input file and return processed data."""
-    with open(filename, 'r') as f:
-        lines = f.read().strip().split('\\n')
-    return lines
+    # every line, blank ones included; for stripped non-empty records (e.g. a
+    # comma-separated list) use iter_records(filename, b',', 'utf-8') instead
+    return read_lines(filename)
 
 def solve(data):
     """
@@ -27,6 +35,21 @@ def solve(data):
     # TODO: Implement solution
     pass
 
+def solve_stream(records):
+    """
+    Solve the puzzle one input line at a time.
+
+    The harness calls this instead of read_input()/solve() for very large or
+    piped input. Rewrite it as a fold over records to run in constant memory.
+
+    Args:
+        records: Iterable of input lines (str, without line endings)
+
+    Returns:
+        Solution answer
+    """
+    return solve(list(records))
+
 if __name__ == "__main__":
     import sys
 
@@ -0,0 +1,253 @@
+"""
+HTTP transport for the AoC client.
+
+Wraps a pooled requests.Session with separate connect and read timeouts,
+retries with jittered exponential backoff, a politeness limiter shared across
+threads, streaming downloads to disk, and latency/retry metrics.
+
+Only requests that are safe to repeat are retried: GET and HEAD on connection
+errors, timeouts and 429/5xx replies, but a POST (an answer submission) only
+when the connection was never made or the server answered 429.
+"""
+import os
+import random
+import threading
+from time import monotonic, perf_counter, sleep
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {'GET', 'HEAD'}
+CHUNK_SIZE = 1 << 16
+
+
+def backoff_delays(initial=0.25, factor=1.5, maximum=5.0, jitter=0.5, rng=random):
+    """
+    Endless exponential backoff delays with jitter.
+
+    Args:
+        initial: First delay in seconds
+        factor: Growth per attempt
+        maximum: Largest delay before jitter
+        jitter: Each delay is randomly scaled by up to this fraction either way
+        rng: Source of randomness
+
+    Yields:
+        float: Seconds to wait before the next attempt
+    """
+    delay = initial
+    while True:
+        yield delay * (1 + rng.uniform(-jitter, jitter))
+        delay = min(delay * factor, maximum)
+
+
+def retry_after(response):
+    """Seconds asked for by a Retry-After header, or None."""
+    value = response.headers.get('Retry-After', '')
+    return float(value) if value.isdigit() else None
+
+
+def connection_not_made(error):
+    """
+    Whether a failed request certainly never reached the server.
+
+    Args:
+        error: requests.ConnectionError or requests.Timeout
+
+    Returns:
+        bool: True if connecting timed out or was refused (or the host didn't
+            resolve), False if the request may have been sent
+    """
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    # requests wraps urllib3's MaxRetryError, whose reason is the underlying failure
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+class RequestLimiter:
+    """Spaces out requests made from any number of threads."""
+
+    def __init__(self, min_interval):
+        """
+        Args:
+            min_interval: Seconds between the starts of consecutive requests
+        """
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        """Block until this caller's turn to send a request."""
+        with self._lock:
+            now = monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        if slot > now:
+            sleep(slot - now)
+
+
+class TransportMetrics:
+    """Request counts and latencies, safe to update from several threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.latencies = []
+
+    def record(self, seconds, failed=False):
+        """Count one attempt and how long it took."""
+        with self._lock:
+            self.requests += 1
+            self.failures += failed
+            self.latencies.append(seconds)
+
+    def record_retry(self):
+        """Count one retried attempt."""
+        with self._lock:
+            self.retries += 1
+
+    def summary(self):
+        """
+        Totals and latency statistics so far.
+
+        Returns:
+            dict: requests, retries, failures, and median/p95/max latency in
+                seconds (None before the first request)
+        """
+        from lib.bench import percentile
+
+        with self._lock:
+            latencies = list(self.latencies)
+            result = {'requests': self.requests, 'retries': self.retries, 'failures': self.failures}
+        result['median'] = percentile(latencies, 0.5) if latencies else None
+        result['p95'] = percentile(latencies, 0.95) if latencies else None
+        result['max'] = max(latencies) if latencies else None
+        return result
+
+    def format(self):
+        """One-line summary, e.g. for the end of a fetch."""
+        from lib.bench import format_duration
+
+        stats = self.summary()
+        line = f"HTTP: {stats['requests']} request(s), {stats['retries']} retried, {stats['failures']} failed"
+        if stats['median'] is not None:
+            line += (f"; latency median {format_duration(stats['median'])}, p95 {format_duration(stats['p95'])}, "
+                     f"max {format_duration(stats['max'])}")
+        return line
+
+
+class Transport:
+    """Retrying, pooled HTTP transport."""
+
+    def __init__(self, retries=3, connect_timeout=5.0, read_timeout=30.0, backoff=0.5, max_backoff=10.0,
+                 pool_size=10, min_interval=0.0):
+        """
+        Args:
+            retries: Extra attempts after a failed one
+            connect_timeout: Seconds to wait for a connection
+            read_timeout: Seconds to wait for each read from the server
+            backoff: First retry delay in seconds, growing 2x per retry (with jitter)
+            max_backoff: Longest retry delay before jitter, also the cap on Retry-After
+            pool_size: Keep-alive connections kept per host, for concurrent requests
+            min_interval: Seconds between requests across all threads
+        """
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self.retries = retries
+        self.timeout = (connect_timeout, read_timeout)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.limiter = RequestLimiter(min_interval)
+        self.metrics = TransportMetrics()
+
+    def request(self, method, url, **kwargs):
+        """
+        Send a request, retrying transient failures.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed on to requests.Session.request()
+
+        Returns:
+            requests.Response: The final response, whatever its status
+
+        Raises:
+            requests.RequestException: If the last attempt failed to connect or timed out
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        method = method.upper()
+        delays = backoff_delays(self.backoff, 2, self.max_backoff)
+
+        for attempt in range(self.retries + 1):
+            last_attempt = attempt == self.retries
+            self.limiter.wait()
+            start = perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self.metrics.record(perf_counter() - start, failed=True)
+                # a POST may have reached the server unless the connection itself failed
+                safe = method in IDEMPOTENT_METHODS or connection_not_made(e)
+                if last_attempt or not safe:
+                    raise
+                delay = next(delays)
+            else:
+                self.metrics.record(perf_counter() - start)
+                status = response.status_code
+                safe = method in IDEMPOTENT_METHODS or status == 429
+                if last_attempt or status not in RETRY_STATUSES or not safe:
+                    return response
+                # a long Retry-After is capped like any other delay rather than stalling the caller
+                delay = min(retry_after(response) or next(delays), self.max_backoff)
+                response.close()
+
+            self.metrics.record_retry()
+            sleep(delay)
+
+    def download(self, url, path, **kwargs):
+        """
+        Stream a response body to a file without holding it in memory.
+
+        The file is written next to `path` and moved into place once complete,
+        and a connection dropped halfway restarts the download.
+
+        Args:
+            url: URL to GET
+            path: File to write
+            **kwargs: Passed on to request()
+
+        Returns:
+            requests.Response: The response, with its body already consumed
+
+        Raises:
+            requests.HTTPError: If the server answers with an error status
+        """
+        tmp_path = f"{path}.part"
+        for attempt in range(self.retries + 1):
+            response = self.request('GET', url, stream=True, **kwargs)
+            try:
+                response.raise_for_status()
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        f.write(chunk)
+            except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError):
+                if attempt == self.retries:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                    raise
+                self.metrics.record_retry()
+                continue
+            finally:
+                response.close()
+
+            os.replace(tmp_path, path)
+            return response
@@ -0,0 +1,134 @@
+"""
+Fetching a day the moment it unlocks.
+
+The client's connection is opened a few seconds before the unlock time, so the
+first real request skips the TCP and TLS handshakes. At the unlock time the
+problem page and then the input are requested, each retried with short
+jittered backoff while the server still answers 404 (clocks never agree to the
+millisecond, and the input can show up a moment after the page).
+"""
+from time import sleep, time
+
+import requests
+
+from lib.transport import backoff_delays
+from lib.utils import unlock_time
+
+
+def sleep_until(timestamp, on_wait=None):
+    """
+    Sleep until a Unix time, waking up periodically on long waits.
+
+    Args:
+        timestamp: Unix time to wake up at
+        on_wait: Called with the seconds left before each long (up to 10 minute) sleep
+    """
+    while True:
+        remaining = timestamp - time()
+        if remaining <= 0:
+            return
+        if remaining > 120:
+            if on_wait:
+                on_wait(remaining)
+            sleep(min(remaining - 60, 600))
+        else:
+            # halving the sleeps lands close to the target despite timer slack
+            sleep(max(remaining / 2, 0.005))
+
+
+def wait_for_unlock(client, day, warmup=5.0, timeout=300.0, log=print):
+    """
+    Sleep until a day unlocks, then poll until its problem page is up.
+
+    Args:
+        client: AoCClient to warm up and fetch with
+        day: Day number (1-12)
+        warmup: Seconds before the unlock to open the connection
+        timeout: Seconds after the unlock to keep retrying 404s
+        log: Called with each progress message
+
+    Returns:
+        str: Problem page HTML
+
+    Raises:
+        TimeoutError: If the page is still missing after `timeout` seconds
+        requests.RequestException: On errors other than a 404
+    """
+    unlock = unlock_time(day).timestamp()
+
+    if unlock - warmup > time():
+        local = unlock_time(day).astimezone().strftime('%Y-%m-%d %H:%M:%S %Z')
+        log(f"Day {day} unlocks at {local}")
+        sleep_until(unlock - warmup, lambda left: log(f"  {format_wait(left)} to go..."))
+
+    try:
+        client.warm_up()
+        log("Connection warmed up")
+    except requests.RequestException as e:
+        log(f"Warm-up failed ({e}), continuing anyway")
+
+    sleep_until(unlock)
+    started = time()
+    html, attempts = retry_not_found(lambda: client.download_problem(day), started + timeout,
+                                     f"Day {day} still not available after {timeout:.0f}s of retrying")
+    log(f"Day {day} is up after {time() - started:.2f}s ({attempts} attempt(s))")
+    return html
+
+
+def wait_for_input(client, day, path, timeout=300.0, log=print):
+    """
+    Save a day's input, polling while the server still answers 404.
+
+    Args:
+        client: AoCClient to fetch with
+        day: Day number (1-12)
+        path: File to write the input to
+        timeout: Seconds to keep retrying 404s
+        log: Called with each progress message
+
+    Raises:
+        TimeoutError: If the input is still missing after `timeout` seconds
+        requests.RequestException: On errors other than a 404
+    """
+    _, attempts = retry_not_found(lambda: client.save_input(day, path), time() + timeout,
+                                  f"Day {day} input still not available after {timeout:.0f}s of retrying")
+    log(f"Input saved ({attempts} attempt(s))")
+
+
+def retry_not_found(fetch, deadline, message):
+    """
+    Call fetch() until it stops failing with a 404.
+
+    Args:
+        fetch: Function making the request
+        deadline: Unix time after which to give up
+        message: TimeoutError message when giving up
+
+    Returns:
+        tuple: (fetch() result, number of attempts)
+
+    Raises:
+        TimeoutError: If fetch() still gets a 404 after the deadline
+        requests.RequestException: On errors other than a 404
+    """
+    attempts = 0
+    for delay in backoff_delays():
+        attempts += 1
+        try:
+            return fetch(), attempts
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                raise
+
+        if time() > deadline:
+            raise TimeoutError(message)
+        sleep(delay)
+
+
+def format_wait(seconds):
+    """Format a long wait as e.g. '3h 05m' or '12m 30s'."""
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f"{hours}h {minutes:02d}m" if hours else f"{minutes}m {seconds:02d}s"
+
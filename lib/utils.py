@@ -1,10 +1,14 @@
 """
 Utility functions for Advent of Code test harness.
 """
-from datetime import datetime
-from dotenv import load_dotenv
+from datetime import datetime, timezone
+import hashlib
 import os
 
+STATE_DIR = '.aoc'  # local, gitignored store for harness history and caches
+YEAR = 2025
+UNLOCK_HOUR_UTC = 5  # puzzles unlock at midnight EST (UTC-5)
+
 
 def get_current_day():
     """
@@ -43,6 +47,33 @@ def validate_day(day):
     return day
 
 
+def unlock_time(day):
+    """
+    When a day's puzzle unlocks.
+
+    Args:
+        day: Day number (1-12)
+
+    Returns:
+        datetime: Unlock time, timezone-aware in UTC
+    """
+    return datetime(YEAR, 12, day, UNLOCK_HOUR_UTC, tzinfo=timezone.utc)
+
+
+def unlocked_days(now=None):
+    """
+    Days whose puzzles have unlocked.
+
+    Args:
+        now: Time to check at (defaults to the current time)
+
+    Returns:
+        list: Day numbers (1-12), in order
+    """
+    now = now or datetime.now(timezone.utc)
+    return [day for day in range(1, 13) if unlock_time(day) <= now]
+
+
 def load_session_cookie():
     """
     Load AOC_SESSION from .env file.
@@ -53,6 +84,8 @@ def load_session_cookie():
     Raises:
         ValueError: If AOC_SESSION not found in .env
     """
+    from dotenv import load_dotenv
+
     load_dotenv()
     session = os.getenv('AOC_SESSION')
     if not session:
@@ -96,3 +129,49 @@ def ensure_directory(path):
         path: Directory path to create
     """
     os.makedirs(path, exist_ok=True)
+
+
+def find_days():
+    """
+    Find the days that have been initialized in the current directory.
+
+    Returns:
+        list: Sorted day numbers that have a dayN/ folder
+    """
+    days = []
+    for name in os.listdir('.'):
+        if name.startswith('day') and name[3:].isdigit() and os.path.isdir(name):
+            days.append(int(name[3:]))
+    return sorted(days)
+
+
+def state_path(*parts):
+    """
+    Path inside the harness state directory, creating its parent folders.
+
+    Args:
+        *parts: Path components under .aoc/
+
+    Returns:
+        str: The joined path
+    """
+    path = os.path.join(STATE_DIR, *parts)
+    ensure_directory(os.path.dirname(path))
+    return path
+
+
+def file_sha256(path):
+    """
+    SHA-256 of a file's contents.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
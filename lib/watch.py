@@ -0,0 +1,129 @@
+"""
+Watch mode for solutions.
+
+One process stays alive and polls a day's files. When something changes, only
+the solutions affected by it are re-executed, then the solutions are rerun on
+the test input and the real input. Skipping interpreter startup and unrelated
+imports keeps each edit-run cycle fast.
+"""
+import os
+import time
+import traceback
+from time import perf_counter
+
+from lib.runner import load_solution, input_path, run_solution, solution_path
+
+
+def watched_files(day, parts):
+    """
+    Files whose changes trigger a rerun.
+
+    Args:
+        day: Day number (1-12)
+        parts: Part numbers being watched
+
+    Returns:
+        list: Solution scripts, helper modules in the day folder and both inputs
+    """
+    day_dir = f"day{day}"
+    scripts = [solution_path(day, part) for part in parts]
+    helpers = sorted(
+        os.path.join(day_dir, name) for name in os.listdir(day_dir)
+        if name.endswith('.py') and not name.startswith('step')
+    )
+    return scripts + helpers + [input_path(day, test=True), input_path(day)]
+
+
+def snapshot(paths):
+    """
+    Modification times of files.
+
+    Args:
+        paths: Files to check
+
+    Returns:
+        dict: path -> st_mtime_ns, or None for missing files
+    """
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            mtimes[path] = None
+    return mtimes
+
+
+def reload_changed(day, parts, changed):
+    """
+    Re-execute the solutions affected by changed files.
+
+    Helper modules aren't kept in sys.modules (see load_solution()), so
+    re-executing a solution imports a fresh copy of every helper it uses. A
+    changed helper therefore reloads every watched solution.
+
+    Args:
+        day: Day number (1-12)
+        parts: Part numbers being watched
+        changed: Paths that changed since the last run
+    """
+    helpers_changed = any(
+        path.endswith('.py') and not os.path.basename(path).startswith('step') for path in changed
+    )
+    for part in parts:
+        if helpers_changed or solution_path(day, part) in changed:
+            load_solution(day, part, reload=True)
+
+
+def run_parts(day, parts, on_result):
+    """
+    Run the solutions on the test input, then the real input.
+
+    Args:
+        day: Day number (1-12)
+        parts: Part numbers to run
+        on_result: Called with (part, test, answer, seconds, error) for each run;
+            error is traceback text or None
+    """
+    for test in (True, False):
+        if not os.path.exists(input_path(day, test)):
+            continue
+        for part in parts:
+            start = perf_counter()
+            try:
+                answer, error = run_solution(day, part, test=test), None
+            except Exception:
+                answer, error = None, traceback.format_exc()
+            on_result(part, test, answer, perf_counter() - start, error)
+
+
+def watch(day, parts, on_result, on_change=None, interval=0.5):
+    """
+    Run solutions now and again after every change to their files, until interrupted.
+
+    Args:
+        day: Day number (1-12)
+        parts: Part numbers to watch
+        on_result: See run_parts()
+        on_change: Called with the list of changed paths before each rerun
+        interval: Seconds between polls
+    """
+    paths = watched_files(day, parts)
+    mtimes = snapshot(paths)
+    changed = paths
+
+    while True:
+        if changed:
+            try:
+                reload_changed(day, parts, changed)
+            except Exception:
+                # a syntax error while editing; report it and wait for the next save
+                traceback.print_exc()
+            else:
+                run_parts(day, parts, on_result)
+
+        time.sleep(interval)
+        current = snapshot(paths)
+        changed = [path for path in paths if current[path] != mtimes[path]]
+        mtimes = current
+        if changed and on_change:
+            on_change(changed)